@@ -3,6 +3,8 @@ import json
 import os
 from pathlib import Path
 
+from utils.websocket_client import KrakenWebSocketClient
+
 
 @pytest.fixture(scope="session")
 def kraken_ws_url():
@@ -16,7 +18,7 @@ def schemas_dir():
     return Path(__file__).parent.parent / "schemas"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def load_schema(schemas_dir):
     """Factory fixture to load JSON schemas."""
     def _load_schema(schema_name):
@@ -28,7 +30,21 @@ def load_schema(schemas_dir):
     return _load_schema
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_timeout():
     """Default timeout for WebSocket operations in seconds."""
     return 30
+
+
+@pytest.fixture(scope="module")
+def ws_client(kraken_ws_url, default_timeout):
+    """Connected client shared by all tests in a module (one handshake per module, no close handshake)."""
+    with KrakenWebSocketClient(kraken_ws_url, timeout=default_timeout, fast_close=True) as client:
+        yield client
+
+
+@pytest.fixture(scope="class")
+def shared_client(kraken_ws_url, default_timeout):
+    """Connected client shared by all tests in a class (one handshake per class, no close handshake)."""
+    with KrakenWebSocketClient(kraken_ws_url, timeout=default_timeout, fast_close=True) as client:
+        yield client
@@ -0,0 +1,172 @@
+"""
+Tests for AsyncKrakenWebSocketClient against a local websockets server
+
+The server speaks just enough of the v2 API for the client: it acks
+subscribe/unsubscribe requests, sends a heartbeat after each subscribe and
+then DATA_MESSAGES update messages for the subscribed channel. No network
+access to Kraken is needed.
+"""
+
+import asyncio
+import json
+import pytest
+
+from websockets.asyncio.server import serve
+
+from utils.async_websocket_client import AsyncKrakenWebSocketClient, gather_messages, run
+from utils.websocket_client import _build_request
+
+# Update messages sent after each subscription
+DATA_MESSAGES = 3
+# Pair the fake server rejects, like Kraken does for unknown pairs
+INVALID_SYMBOL = "INVALID/PAIR"
+
+
+class FakeKraken:
+    """Minimal v2 endpoint; every frame it receives is kept in self.frames."""
+
+    def __init__(self):
+        self.frames = []
+        self.url = None
+        self._server = None
+
+    async def __aenter__(self):
+        self._server = await serve(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._server.close()
+        await self._server.wait_closed()
+        return False
+
+    async def _handle(self, ws):
+        async for frame in ws:
+            self.frames.append(frame)
+            request = json.loads(frame)
+            method = request["method"]
+            params = request["params"]
+
+            if INVALID_SYMBOL in params["symbol"]:
+                await ws.send(json.dumps({"method": method, "success": False,
+                                          "error": f"Currency pair not supported {INVALID_SYMBOL}"}))
+                continue
+
+            await ws.send(json.dumps({"method": method, "success": True,
+                                      "result": {"channel": params["channel"], "symbol": params["symbol"][0]}}))
+            if method == "subscribe":
+                await ws.send(json.dumps({"channel": "heartbeat"}))
+                for seq in range(DATA_MESSAGES):
+                    await ws.send(json.dumps({"channel": params["channel"], "type": "update",
+                                              "data": [{"symbol": params["symbol"][0], "seq": seq}]}))
+
+
+class TestAsyncClient:
+    """AsyncKrakenWebSocketClient request encoding and message handling."""
+
+    def test_subscribe_receive_unsubscribe(self):
+        """Test the subscribe -> receive -> unsubscribe flow and the frames sent."""
+        print("\n[ASYNC CLIENT] Testing subscribe/receive/unsubscribe...")
+
+        async def scenario():
+            async with FakeKraken() as server:
+                async with AsyncKrakenWebSocketClient(server.url, timeout=5) as client:
+                    ack = await client.subscribe("ticker", ["BTC/USD"], snapshot=False)
+                    messages = await client.receive_messages(count=DATA_MESSAGES, timeout=5)
+                    unsub_ack = await client.unsubscribe("ticker", ["BTC/USD"], snapshot=False)
+                return server.frames, ack, messages, unsub_ack
+
+        frames, ack, messages, unsub_ack = run(scenario())
+
+        assert ack.get("success") is True
+        assert unsub_ack.get("method") == "unsubscribe"
+        # Heartbeat and acks are skipped
+        assert [msg["data"][0]["seq"] for msg in messages] == list(range(DATA_MESSAGES))
+        print(f"  ✓ Received {len(messages)} data messages")
+
+        # Same text frames the sync client sends
+        assert frames == [
+            _build_request("subscribe", "ticker", ["BTC/USD"], {"snapshot": False}).decode(),
+            _build_request("unsubscribe", "ticker", ["BTC/USD"], {"snapshot": False}).decode(),
+        ]
+        print("  ✓ Requests match the sync client's payloads")
+
+    def test_subscribe_rejected(self):
+        """Test that an error ack raises ValueError."""
+        print("\n[ASYNC CLIENT] Testing rejected subscription...")
+
+        async def scenario():
+            async with FakeKraken() as server:
+                async with AsyncKrakenWebSocketClient(server.url, timeout=5) as client:
+                    await client.subscribe("ticker", [INVALID_SYMBOL])
+
+        with pytest.raises(ValueError, match="Subscription failed"):
+            run(scenario())
+        print("  ✓ Error ack raised ValueError")
+
+    def test_short_read_times_out(self):
+        """Test that receive_messages raises TimeoutError when fewer than count messages arrive."""
+        print("\n[ASYNC CLIENT] Testing short read...")
+
+        async def scenario():
+            async with FakeKraken() as server:
+                async with AsyncKrakenWebSocketClient(server.url, timeout=5) as client:
+                    await client.subscribe("ticker", ["BTC/USD"])
+                    await client.receive_messages(count=DATA_MESSAGES + 1, timeout=0.5)
+
+        with pytest.raises(TimeoutError, match=f"Got {DATA_MESSAGES}/{DATA_MESSAGES + 1}"):
+            run(scenario())
+        print("  ✓ Short read raised TimeoutError")
+
+    def test_iter_messages(self):
+        """Test iterating data messages with async for."""
+        print("\n[ASYNC CLIENT] Testing iter_messages...")
+
+        async def scenario():
+            async with FakeKraken() as server:
+                async with AsyncKrakenWebSocketClient(server.url, timeout=5) as client:
+                    await client.subscribe("trade", ["BTC/USD"])
+                    received = []
+                    async for msg in client.iter_messages(timeout=5):
+                        received.append(msg)
+                        if len(received) == DATA_MESSAGES:
+                            break
+                    # The stream is drained; the next wait times out
+                    with pytest.raises(TimeoutError):
+                        await client.receive_data_message(timeout=0.2)
+                    return received
+
+        received = run(scenario())
+        assert [msg["data"][0]["seq"] for msg in received] == list(range(DATA_MESSAGES))
+        print(f"  ✓ Iterated {len(received)} data messages")
+
+    def test_gather_messages(self):
+        """Test receiving from several clients concurrently."""
+        print("\n[ASYNC CLIENT] Testing gather_messages...")
+        channels = ["ticker", "trade", "book"]
+
+        async def scenario():
+            async with FakeKraken() as server:
+                clients = [AsyncKrakenWebSocketClient(server.url, timeout=5) for _ in channels]
+                for client, channel in zip(clients, channels):
+                    await client.connect()
+                    await client.subscribe(channel, ["BTC/USD"])
+                try:
+                    return await gather_messages(clients, count=DATA_MESSAGES, timeout=5)
+                finally:
+                    for client in clients:
+                        await client.disconnect()
+
+        results = run(scenario())
+        # One list per client, in client order
+        assert [[msg["channel"] for msg in messages] for messages in results] == \
+            [[channel] * DATA_MESSAGES for channel in channels]
+        print(f"  ✓ Gathered {DATA_MESSAGES} messages from each of {len(channels)} clients")
+
+    def test_not_connected(self):
+        """Test that using the client before connect() raises RuntimeError."""
+        client = AsyncKrakenWebSocketClient("ws://127.0.0.1:1")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(client.subscribe("ticker", ["BTC/USD"]))
@@ -19,6 +19,7 @@ import time
 import zlib
 from utils.websocket_client import KrakenWebSocketClient
 from utils.validators import validate_schema
+from utils.helpers import count_message_types
 
 
 def calculate_book_checksum(bids, asks, depth=10):
@@ -485,8 +486,7 @@ class TestBookChannel:
             print(f"  Subscription: success={ack.get('success')}")
             assert ack.get("success") is True
 
-            messages = client.receive_messages(count=1, timeout=30)
-            book_data = messages[0].get("data", [])[0]
+            book_data = client.receive_data_message(timeout=30).get("data", [])[0]
             bids = book_data.get("bids", [])
             asks = book_data.get("asks", [])
 
@@ -512,8 +512,7 @@ class TestBookChannel:
             print(f"  Subscription: success={ack.get('success')}")
             assert ack.get("success") is True
 
-            messages = client.receive_messages(count=1, timeout=30)
-            book_data = messages[0].get("data", [])[0]
+            book_data = client.receive_data_message(timeout=30).get("data", [])[0]
             bids = book_data.get("bids", [])
             asks = book_data.get("asks", [])
 
@@ -551,8 +550,7 @@ class TestBookChannel:
             print(f"  Subscription: success={ack.get('success')}")
             assert ack.get("success") is True
 
-            messages = client.receive_messages(count=1, timeout=30)
-            book_data = messages[0].get("data", [])[0]
+            book_data = client.receive_data_message(timeout=30).get("data", [])[0]
             bids = book_data.get("bids", [])
             asks = book_data.get("asks", [])
 
@@ -682,8 +680,7 @@ class TestBookChannelNegativeScenarios:
                 # Must succeed and default to 10
                 assert ack.get("success") is True, "BUG: depth=0 was rejected instead of defaulting to 10"
 
-                messages = client.receive_messages(count=1, timeout=30)
-                book_data = messages[0].get("data", [])[0]
+                book_data = client.receive_data_message(timeout=30).get("data", [])[0]
                 actual_bids = len(book_data.get('bids', []))
                 actual_asks = len(book_data.get('asks', []))
                 print(f"  Received: {actual_bids} bids, {actual_asks} asks")
@@ -710,8 +707,7 @@ class TestBookChannelNegativeScenarios:
                 # Must succeed and default to 10
                 assert ack.get("success") is True, "BUG: depth=17 was rejected instead of defaulting to 10"
 
-                messages = client.receive_messages(count=1, timeout=30)
-                book_data = messages[0].get("data", [])[0]
+                book_data = client.receive_data_message(timeout=30).get("data", [])[0]
                 actual_bids = len(book_data.get('bids', []))
                 actual_asks = len(book_data.get('asks', []))
                 print(f"  Received: {actual_bids} bids, {actual_asks} asks")
@@ -738,8 +734,7 @@ class TestBookChannelNegativeScenarios:
                 # Must succeed and default to 10
                 assert ack.get("success") is True, "BUG: depth=None was rejected instead of defaulting to 10"
 
-                messages = client.receive_messages(count=1, timeout=30)
-                book_data = messages[0].get("data", [])[0]
+                book_data = client.receive_data_message(timeout=30).get("data", [])[0]
                 actual_bids = len(book_data.get('bids', []))
                 actual_asks = len(book_data.get('asks', []))
                 print(f"  Received: {actual_bids} bids, {actual_asks} asks")
@@ -766,8 +761,7 @@ class TestBookChannelNegativeScenarios:
                 # Must succeed and default to 10
                 assert ack.get("success") is True, "BUG: depth='' was rejected instead of defaulting to 10"
 
-                messages = client.receive_messages(count=1, timeout=30)
-                book_data = messages[0].get("data", [])[0]
+                book_data = client.receive_data_message(timeout=30).get("data", [])[0]
                 actual_bids = len(book_data.get('bids', []))
                 actual_asks = len(book_data.get('asks', []))
                 print(f"  Received: {actual_bids} bids, {actual_asks} asks")
@@ -796,8 +790,7 @@ class TestBookChannelNegativeScenarios:
             assert ack.get("success") is True
 
             # Should receive snapshot message (default=true)
-            messages = client.receive_messages(count=1, timeout=30)
-            first_msg = messages[0]
+            first_msg = client.receive_data_message(timeout=30)
 
             print(f"  First message type: {first_msg.get('type')}")
             assert first_msg.get('type') == 'snapshot', \
@@ -818,8 +811,7 @@ class TestBookChannelNegativeScenarios:
             assert ack.get("success") is True
 
             # Should receive snapshot message
-            messages = client.receive_messages(count=1, timeout=30)
-            first_msg = messages[0]
+            first_msg = client.receive_data_message(timeout=30)
 
             print(f"  First message type: {first_msg.get('type')}")
             assert first_msg.get('type') == 'snapshot', \
@@ -842,8 +834,8 @@ class TestBookChannelNegativeScenarios:
             # Should NOT receive snapshot message, only updates
             messages = client.receive_messages(count=3, timeout=30)
 
-            snapshot_count = sum(1 for msg in messages if msg.get('type') == 'snapshot')
-            update_count = sum(1 for msg in messages if msg.get('type') == 'update')
+            counts = count_message_types(messages)
+            snapshot_count, update_count = counts['snapshot'], counts['update']
 
             print(f"  Received: {snapshot_count} snapshots, {update_count} updates")
             assert snapshot_count == 0, \
@@ -866,8 +858,7 @@ class TestBookChannelNegativeScenarios:
                 assert ack.get("success") is True, "BUG: snapshot=None was rejected instead of defaulting to true"
 
                 # Should receive snapshot message (default=true)
-                messages = client.receive_messages(count=1, timeout=30)
-                first_msg = messages[0]
+                first_msg = client.receive_data_message(timeout=30)
 
                 print(f"  First message type: {first_msg.get('type')}")
                 assert first_msg.get('type') == 'snapshot', \
@@ -892,8 +883,7 @@ class TestBookChannelNegativeScenarios:
                 assert ack.get("success") is True, "BUG: snapshot='invalid' was rejected instead of defaulting to true"
 
                 # Should receive snapshot message (default=true)
-                messages = client.receive_messages(count=1, timeout=30)
-                first_msg = messages[0]
+                first_msg = client.receive_data_message(timeout=30)
 
                 print(f"  First message type: {first_msg.get('type')}")
                 assert first_msg.get('type') == 'snapshot', \
@@ -918,8 +908,7 @@ class TestBookChannelNegativeScenarios:
                 assert ack.get("success") is True, "BUG: snapshot=123 was rejected instead of defaulting to true"
 
                 # Should receive snapshot message (default=true)
-                messages = client.receive_messages(count=1, timeout=30)
-                first_msg = messages[0]
+                first_msg = client.receive_data_message(timeout=30)
 
                 print(f"  First message type: {first_msg.get('type')}")
                 assert first_msg.get('type') == 'snapshot', \
@@ -0,0 +1,158 @@
+"""
+Tests for the channel message helpers (utils/helpers.py)
+
+parse_channel_message() returns a ChannelMessage NamedTuple and
+extract_trades_data() a TRADE_DTYPE structured array; these tests pin down
+both return types and the extract() dispatch. No connection to Kraken is made.
+"""
+
+import numpy as np
+import pytest
+
+from utils.helpers import (
+    TRADE_DTYPE,
+    ChannelMessage,
+    extract,
+    extract_book_data,
+    extract_ohlc_data,
+    extract_ticker_data,
+    extract_trades_data,
+    parse_channel_message,
+)
+
+TICKER_FRAME = [42, {"c": ["1.0", "0.1"], "v": ["5", "9"]}, "ticker", "XBT/USD"]
+BOOK_SNAPSHOT_FRAME = [7, {"as": [["101.0", "1.0", "1"]], "bs": [["100.0", "2.0", "1"]]}, "book-10", "XBT/USD"]
+BOOK_UPDATE_FRAME = [7, {"a": [["101.5", "0.5", "2"]]}, "book-10", "XBT/USD"]
+OHLC_FRAME = [9, ["1.0", "61.0", "100.0", "105.0", "99.0", "104.0", "102.0", "3.5", 12], "ohlc-1", "XBT/USD"]
+TRADE_FRAME = [
+    3,
+    [
+        ["100.5", "0.25", "1700000000.1", "b", "l", ""],
+        ["100.4", "1.00", "1700000000.2", "sell", "market", ""],
+        ["short"],  # fewer than 6 fields; skipped
+    ],
+    "trade",
+    "XBT/USD",
+]
+
+
+class TestParseChannelMessage:
+    """parse_channel_message() and the ChannelMessage it returns."""
+
+    def test_fields(self):
+        """Test that the four frame elements map to named fields plus the channel prefix."""
+        msg = parse_channel_message(BOOK_SNAPSHOT_FRAME)
+
+        assert isinstance(msg, ChannelMessage)
+        assert msg.channel_id == 7
+        assert msg.data is BOOK_SNAPSHOT_FRAME[1]
+        assert msg.channel_name == "book-10"
+        assert msg.pair == "XBT/USD"
+        assert msg.channel_prefix == "book"
+        print("  ✓ ChannelMessage fields populated")
+
+    def test_extra_elements_ignored(self):
+        """Test that elements after the pair are dropped."""
+        msg = parse_channel_message(TICKER_FRAME + ["extra"])
+        assert msg == (42, TICKER_FRAME[1], "ticker", "XBT/USD", "ticker")
+        print("  ✓ Extra elements ignored")
+
+    def test_non_string_channel_name(self):
+        """Test that a non-string channel name gets an empty prefix instead of raising."""
+        assert parse_channel_message([1, {}, None, "XBT/USD"]).channel_prefix == ""
+        print("  ✓ Non-string channel name handled")
+
+    @pytest.mark.parametrize("message", [
+        pytest.param({"event": "heartbeat"}, id="event"),
+        pytest.param([1, {}, "ticker"], id="short_list"),
+        pytest.param(None, id="none"),
+    ])
+    def test_not_a_channel_message(self, message):
+        """Test that event dicts and short lists are not channel messages."""
+        assert parse_channel_message(message) is None
+        print("  ✓ Not a channel message")
+
+
+class TestExtract:
+    """extract() dispatch and the per-channel extractors."""
+
+    def test_ticker(self):
+        """Test ticker fields are renamed and missing ones default to []."""
+        data = extract(parse_channel_message(TICKER_FRAME))
+
+        assert data == extract_ticker_data(parse_channel_message(TICKER_FRAME))
+        assert data["close"] == ["1.0", "0.1"]
+        assert data["volume"] == ["5", "9"]
+        assert data["ask"] == []
+        print("  ✓ Ticker extracted")
+
+    def test_book(self):
+        """Test book snapshots and updates by channel prefix."""
+        snapshot = extract(parse_channel_message(BOOK_SNAPSHOT_FRAME))
+        update = extract(parse_channel_message(BOOK_UPDATE_FRAME))
+
+        assert snapshot == {"type": "snapshot", "asks": [["101.0", "1.0", "1"]], "bids": [["100.0", "2.0", "1"]]}
+        assert update == {"type": "update", "asks": [["101.5", "0.5", "2"]], "bids": []}
+        assert update == extract_book_data(parse_channel_message(BOOK_UPDATE_FRAME))
+        print("  ✓ Book snapshot and update extracted")
+
+    def test_ohlc(self):
+        """Test OHLC fields are converted to float and the count to int."""
+        data = extract(parse_channel_message(OHLC_FRAME))
+
+        assert data == {
+            "time": 1.0, "etime": 61.0, "open": 100.0, "high": 105.0, "low": 99.0,
+            "close": 104.0, "vwap": 102.0, "volume": 3.5, "count": 12,
+        }
+        assert all(type(data[field]) is float for field in ("open", "high", "low", "close"))
+
+        # Without the trade count field
+        no_count = parse_channel_message([9, OHLC_FRAME[1][:8], "ohlc-1", "XBT/USD"])
+        assert extract_ohlc_data(no_count)["count"] is None
+        print("  ✓ OHLC extracted")
+
+    def test_trades(self):
+        """Test trades are returned as a TRADE_DTYPE structured array, one row per complete trade."""
+        trades = extract(parse_channel_message(TRADE_FRAME))
+
+        assert isinstance(trades, np.ndarray)
+        assert trades.dtype == TRADE_DTYPE
+        assert len(trades) == 2
+        assert trades["price"].tolist() == [100.5, 100.4]
+        assert trades["volume"].tolist() == [0.25, 1.0]
+        assert trades["time"].tolist() == [1700000000.1, 1700000000.2]
+        # v1 codes and v2 words are both kept whole
+        assert trades["side"].tolist() == ["b", "sell"]
+        assert trades["order_type"].tolist() == ["l", "market"]
+        assert trades["misc"].tolist() == ["", ""]
+        print(f"  ✓ {len(trades)} trades extracted")
+
+    def test_trades_empty(self):
+        """Test that a trade message without complete trades gives None."""
+        assert extract_trades_data(parse_channel_message([3, [], "trade", "XBT/USD"])) is None
+        assert extract_trades_data(parse_channel_message([3, [["1"]], "trade", "XBT/USD"])) is None
+        print("  ✓ No trades gives None")
+
+    def test_trades_value_too_long(self):
+        """Test that a side too long for TRADE_DTYPE raises instead of being truncated."""
+        frame = [3, [["100.5", "0.25", "1700000000.1", "buy-to-open", "l", ""]], "trade", "XBT/USD"]
+
+        with pytest.raises(ValueError, match="longer than 6 characters"):
+            extract_trades_data(parse_channel_message(frame))
+        print("  ✓ Over-long side rejected")
+
+    @pytest.mark.parametrize("extractor, frame", [
+        pytest.param(extract_ticker_data, TRADE_FRAME, id="ticker"),
+        pytest.param(extract_book_data, TICKER_FRAME, id="book"),
+        pytest.param(extract_ohlc_data, TRADE_FRAME, id="ohlc"),
+        pytest.param(extract_trades_data, OHLC_FRAME, id="trade"),
+    ])
+    def test_wrong_channel(self, extractor, frame):
+        """Test that each extractor ignores other channels' messages."""
+        assert extractor(parse_channel_message(frame)) is None
+        print("  ✓ Other channel ignored")
+
+    def test_unknown_channel(self):
+        """Test that extract() returns None for channels without an extractor."""
+        assert extract(parse_channel_message([1, {}, "spread", "XBT/USD"])) is None
+        print("  ✓ Unknown channel gives None")
@@ -17,8 +17,10 @@ Test Organization:
 
 import pytest
 import time
+from datetime import datetime
 from utils.websocket_client import KrakenWebSocketClient
 from utils.validators import validate_schema
+from utils.helpers import count_message_types
 
 
 class TestOHLCChannel:
@@ -331,7 +333,6 @@ class TestOHLCChannel:
 
                     # 7. Timestamp validation: interval_begin < candle timestamp
                     try:
-                        from datetime import datetime
                         interval_begin_dt = datetime.fromisoformat(interval_begin.replace('Z', '+00:00'))
                         candle_timestamp_dt = datetime.fromisoformat(candle_timestamp.replace('Z', '+00:00'))
 
@@ -347,7 +348,6 @@ class TestOHLCChannel:
 
                     # 8. Time difference matches interval exactly
                     try:
-                        from datetime import datetime
                         interval_begin_dt = datetime.fromisoformat(interval_begin.replace('Z', '+00:00'))
                         candle_timestamp_dt = datetime.fromisoformat(candle_timestamp.replace('Z', '+00:00'))
 
@@ -398,8 +398,7 @@ class TestOHLCChannel:
             print(f"  Subscription: success={ack.get('success')}")
             assert ack.get("success") is True
 
-            messages = client.receive_messages(count=1, timeout=30)
-            candle_data = messages[0].get("data", [])[0]
+            candle_data = client.receive_data_message(timeout=30).get("data", [])[0]
             candle_interval = candle_data.get("interval")
 
             print(f"  Received candle with interval: {candle_interval}")
@@ -428,8 +427,7 @@ class TestOHLCChannel:
             print(f"  Subscription: success={ack.get('success')}")
             assert ack.get("success") is True
 
-            messages = client.receive_messages(count=1, timeout=60)
-            candle_data = messages[0].get("data", [])[0]
+            candle_data = client.receive_data_message(timeout=60).get("data", [])[0]
             candle_interval = candle_data.get("interval")
 
             print(f"  Received candle with interval: {candle_interval}")
@@ -464,8 +462,7 @@ class TestOHLCChannel:
             assert ack.get("success") is True
 
             # Should receive snapshot message (default=true)
-            messages = client.receive_messages(count=1, timeout=60)
-            first_msg = messages[0]
+            first_msg = client.receive_data_message(timeout=60)
 
             print(f"  First message type: {first_msg.get('type')}")
             assert first_msg.get('type') == 'snapshot', \
@@ -495,8 +492,7 @@ class TestOHLCChannel:
             assert ack.get("success") is True
 
             # Should receive snapshot message
-            messages = client.receive_messages(count=1, timeout=60)
-            first_msg = messages[0]
+            first_msg = client.receive_data_message(timeout=60)
 
             print(f"  First message type: {first_msg.get('type')}")
             assert first_msg.get('type') == 'snapshot', \
@@ -528,8 +524,8 @@ class TestOHLCChannel:
             # Should NOT receive snapshot message, only updates
             messages = client.receive_messages(count=3, timeout=60)
 
-            snapshot_count = sum(1 for msg in messages if msg.get('type') == 'snapshot')
-            update_count = sum(1 for msg in messages if msg.get('type') == 'update')
+            counts = count_message_types(messages)
+            snapshot_count, update_count = counts['snapshot'], counts['update']
 
             print(f"  Received: {snapshot_count} snapshots, {update_count} updates")
             assert snapshot_count == 0, \
@@ -612,8 +608,7 @@ class TestOHLCChannelNegativeScenarios:
                 "Missing interval should default to 1"
 
             # Verify interval defaults to 1
-            messages = client.receive_messages(count=1, timeout=30)
-            candle_data = messages[0].get("data", [])[0]
+            candle_data = client.receive_data_message(timeout=30).get("data", [])[0]
             candle_interval = candle_data.get("interval")
 
             print(f"  Received candle with interval: {candle_interval}")
@@ -0,0 +1,89 @@
+"""
+Tests for the message recorder (utils/recorder.py)
+
+The recorder's client is replaced by FakeClient, which replays a fixed list
+of frames, so no connection to Kraken is made.
+"""
+
+import pytest
+
+from utils import recorder
+
+ACK_FRAME = '{"event":"subscriptionStatus","status":"subscribed","channelName":"ticker","pair":"XBT/USD"}'
+HEARTBEAT_FRAME = '{"event":"heartbeat"}'
+MALFORMED_FRAME = '{"event":"heartbeat"'  # truncated, not valid JSON
+DATA_FRAME = '[42,{"c":["1.0","0.1"]},"ticker","XBT/USD"]'
+# Valid JSON that does not fit the event envelope (non-string 'event')
+ODD_SHAPE_FRAME = '{"event":["heartbeat"],"data":"x"}'
+
+
+class FakeClient:
+    """Stands in for KrakenWebSocketClient: acks requests and replays FRAMES in order."""
+
+    FRAMES = [ACK_FRAME, HEARTBEAT_FRAME, MALFORMED_FRAME, DATA_FRAME, ODD_SHAPE_FRAME]
+
+    def __init__(self, url, timeout=30):
+        self._frames = iter(self.FRAMES)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def subscribe(self, channel, symbol, **options):
+        return {"event": "subscriptionStatus", "status": "subscribed"}
+
+    def unsubscribe(self, channel, symbol, **options):
+        return {"event": "subscriptionStatus", "status": "unsubscribed"}
+
+    def receive_raw(self, timeout=None):
+        return next(self._frames)
+
+
+class TestRecorder:
+    """Frame filtering in record_messages()."""
+
+    @pytest.mark.parametrize("frame, expected", [
+        pytest.param(ACK_FRAME, "subscriptionStatus", id="ack"),
+        pytest.param(HEARTBEAT_FRAME, "heartbeat", id="heartbeat"),
+        pytest.param(DATA_FRAME, None, id="data"),
+        pytest.param(ODD_SHAPE_FRAME, None, id="odd_shape"),
+        pytest.param(MALFORMED_FRAME, recorder._MALFORMED, id="malformed"),
+    ])
+    def test_frame_event(self, frame, expected):
+        """Test the event lookup for each kind of frame, as str and as bytes."""
+        assert recorder._frame_event(frame) == expected
+        assert recorder._frame_event(frame.encode()) == expected
+
+    def test_record_skips_heartbeat_and_malformed(self, monkeypatch, tmp_path):
+        """Test that heartbeats and malformed frames are skipped without ending the recording."""
+        print("\n[RECORDER] Recording ack, heartbeat, malformed, data and odd-shape frames...")
+        monkeypatch.setattr(recorder, "KrakenWebSocketClient", FakeClient)
+
+        written = recorder.record_messages("ticker", "XBT/USD", count=3, fixtures_dir=tmp_path)
+
+        assert written == 3
+        (messages_file,) = tmp_path.glob("*_messages_*.jsonl")
+        lines = messages_file.read_text().splitlines()
+        assert lines == [ACK_FRAME, DATA_FRAME, ODD_SHAPE_FRAME]
+        print(f"  ✓ Recorded {len(lines)} frames as received")
+
+    def test_writer_drops_after_timeout(self, monkeypatch, tmp_path):
+        """Test that a full write queue blocks for SUBMIT_TIMEOUT, then drops and counts the batch."""
+        print("\n[RECORDER] Submitting to a writer that is not draining its queue...")
+        monkeypatch.setattr(recorder, "SUBMIT_TIMEOUT", 0.1)
+        messages_file = tmp_path / "messages.jsonl"
+        writer = recorder._JsonlWriter(messages_file)
+
+        # Not started yet, so nothing drains the queue
+        for _ in range(recorder.MAX_PENDING_BATCHES):
+            writer.submit([DATA_FRAME.encode()])
+        assert writer.dropped == 0
+        writer.submit([DATA_FRAME.encode(), DATA_FRAME.encode()])
+        assert writer.dropped == 2
+
+        writer.start()
+        writer.close()
+        assert len(messages_file.read_text().splitlines()) == recorder.MAX_PENDING_BATCHES
+        print(f"  ✓ Dropped {writer.dropped} messages after the timeout, wrote the queued ones")
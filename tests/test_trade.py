@@ -10,13 +10,19 @@ Key features:
 - Includes taker side (buy/sell) and order type (limit/market)
 """
 
+import logging
 import pytest
-import json
 import jsonschema
-import os
-from typing import Dict, List
+import re
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import websocket
 
 from utils.websocket_client import KrakenWebSocketClient
+from utils.validators import validate_schema
+
+log = logging.getLogger(__name__)
 
 
 # Constants
@@ -25,18 +31,94 @@ TEST_SYMBOL = "BTC/USD"
 TEST_SYMBOLS_MULTI = ["BTC/USD", "ETH/USD"]
 
 
+# Fields every trade entry must carry
+TRADE_FIELDS = ("symbol", "side", "qty", "price", "ord_type", "trade_id", "timestamp")
+# Allowed enum values (hashed O(1) membership, built once)
+VALID_SIDES = frozenset(("buy", "sell"))
+VALID_ORD_TYPES = frozenset(("limit", "market"))
+MESSAGE_TYPES = frozenset(("snapshot", "update"))
+# RFC3339 UTC timestamp as sent by the API, e.g. 2023-09-25T07:49:36.925603Z
+TS_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z$')
+
+
+# Timeouts tolerated on unsubscribe (high-frequency channels may not ack in time)
+_TIMEOUTS = (TimeoutError, websocket.WebSocketTimeoutException)
+
+
+def _safe_unsubscribe(client: KrakenWebSocketClient, symbol: List[str]) -> Optional[Dict]:
+    """Unsubscribe from trades; returns the ack, or None if it timed out."""
+    try:
+        return client.unsubscribe(channel="trade", symbol=symbol)
+    except _TIMEOUTS as e:
+        print(f"⚠ Unsubscribe timeout (acceptable): {e}")
+        return None
+
+
+@contextmanager
+def trade_subscription(client: KrakenWebSocketClient, symbol: List[str], **options):
+    """Subscribe to trades for the duration of the block; yields the subscription ack."""
+    ack = client.subscribe(channel="trade", symbol=symbol, **options)
+    try:
+        yield ack
+    finally:
+        _safe_unsubscribe(client, symbol)
+
+
+class TradeFeed:
+    """
+    One snapshot=true trade subscription shared by the tests that only need "some trade messages".
+
+    Received data messages are spooled in arrival order and every test reads
+    the same prefix, so each one sees the snapshot first and only waits on the
+    socket when it asks for more messages than were already received.
+    """
+
+    def __init__(self, client: KrakenWebSocketClient, ack: Dict, timeout: int):
+        """
+        Initialize feed over an active subscription.
+
+        Args:
+            client: Connected client subscribed to TEST_SYMBOL trades (snapshot=true)
+            ack: Subscription acknowledgment
+            timeout: Timeout for receiving additional messages
+        """
+        self.client = client
+        self.ack = ack
+        self.timeout = timeout
+        self._spool: List[Dict] = []
+
+    def messages(self, count: int) -> List[Dict]:
+        """
+        Return the first count data messages of the subscription.
+
+        Args:
+            count: Number of messages wanted
+
+        Returns:
+            Up to count messages (fewer only if the stream went quiet after
+            at least one message, as with receive_messages)
+        """
+        missing = count - len(self._spool)
+        if missing > 0:
+            try:
+                self._spool.extend(self.client.receive_messages(count=missing, timeout=self.timeout))
+            except Exception:
+                if not self._spool:
+                    raise
+        return self._spool[:count]
+
+
+@pytest.fixture(scope="module")
+def trade_feed(default_timeout):
+    """Subscribe once to BTC/USD trades (snapshot=true) and unsubscribe after the module, like ws_client."""
+    with KrakenWebSocketClient(WS_URL, timeout=default_timeout, fast_close=True) as client:
+        with trade_subscription(client, [TEST_SYMBOL], snapshot=True) as ack:
+            yield TradeFeed(client, ack, default_timeout)
+
+
 class TestTradeChannel:
     """Test suite for trade channel functionality."""
 
-    @pytest.fixture
-    def schema(self):
-        """Load trade channel JSON schema."""
-        schema_path = os.path.join(
-            os.path.dirname(__file__), '..', 'schemas', 'trade_schema.json'
-        )
-        with open(schema_path) as f:
-            return json.load(f)
-
     def test_trade_complete_flow(self, default_timeout):
         """
         Test complete trade subscription flow.
@@ -61,17 +143,12 @@ class TestTradeChannel:
             # Verify all messages are from trade channel
             for msg in messages:
                 assert msg.get("channel") == "trade"
-                assert msg.get("type") in ["snapshot", "update"]
+                assert msg.get("type") in MESSAGE_TYPES
 
             # Unsubscribe
-            try:
-                unsub = client.unsubscribe(channel="trade", symbol=[TEST_SYMBOL])
+            unsub = _safe_unsubscribe(client, [TEST_SYMBOL])
+            if unsub is not None:
                 print(f"✓ Unsubscribed successfully: {unsub.get('success')}")
-            except Exception as e:
-                # Catch both TimeoutError and WebSocketTimeoutException
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
-                print(f"⚠ Warning: Unsubscribe timed out (acceptable for high-frequency channels): {e}")
 
     def test_trade_snapshot_default(self, default_timeout):
         """
@@ -81,65 +158,36 @@ class TestTradeChannel:
         Note: May timeout if no trades happen in market (acceptable).
         """
         with KrakenWebSocketClient(WS_URL, timeout=default_timeout) as client:
-            ack = client.subscribe(channel="trade", symbol=[TEST_SYMBOL])
-            assert ack.get("success") is True
-
-            # Wait for first message - may timeout if no live trades
-            try:
-                messages = client.receive_messages(count=1, timeout=default_timeout)
-                assert len(messages) >= 1
-
-                # First message might be snapshot or update depending on timing
-                first_msg = messages[0]
-                assert first_msg.get("channel") == "trade"
-                assert first_msg.get("type") in ["snapshot", "update"]
-                print(f"✓ Received {first_msg.get('type')} with {len(first_msg.get('data', []))} trades")
-            except Exception as e:
-                # Timeout is acceptable if no live trades in market
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
-                print(f"⚠ No live trades received within timeout (acceptable for slow market): {e}")
-
-            # Unsubscribe
-            try:
-                client.unsubscribe(channel="trade", symbol=[TEST_SYMBOL])
-            except Exception as e:
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
-                print(f"⚠ Unsubscribe timeout (acceptable): {e}")
+            with trade_subscription(client, [TEST_SYMBOL]) as ack:
+                assert ack.get("success") is True
 
-    def test_trade_snapshot_true(self, default_timeout):
+                # Wait for first message - may timeout if no live trades
+                try:
+                    # First message might be snapshot or update depending on timing
+                    first_msg = client.receive_data_message(timeout=default_timeout)
+                    assert first_msg.get("channel") == "trade"
+                    assert first_msg.get("type") in MESSAGE_TYPES
+                    print(f"✓ Received {first_msg.get('type')} with {len(first_msg.get('data', []))} trades")
+                except _TIMEOUTS as e:
+                    # Timeout is acceptable if no live trades in market
+                    print(f"⚠ No live trades received within timeout (acceptable for slow market): {e}")
+
+    @pytest.mark.xdist_group("trade_feed")
+    def test_trade_snapshot_true(self, trade_feed):
         """
         Test trade channel with snapshot=true.
 
         Should receive snapshot of last 50 trades, then live updates.
         """
-        with KrakenWebSocketClient(WS_URL, timeout=default_timeout) as client:
-            ack = client.subscribe(
-                channel="trade",
-                symbol=[TEST_SYMBOL],
-                snapshot=True
-            )
-            assert ack.get("success") is True
-
-            # Wait for snapshot
-            messages = client.receive_messages(count=1, timeout=default_timeout)
-            assert len(messages) >= 1
+        assert trade_feed.ack.get("success") is True
 
-            snapshot = messages[0]
-            assert snapshot.get("channel") == "trade"
-            assert snapshot.get("type") == "snapshot"
-            assert len(snapshot.get("data", [])) > 0, "Snapshot should contain trade data"
+        # The feed subscribed with snapshot=true, so the first data message is the snapshot
+        snapshot = trade_feed.messages(1)[0]
+        assert snapshot.get("channel") == "trade"
+        assert snapshot.get("type") == "snapshot"
+        assert len(snapshot.get("data", [])) > 0, "Snapshot should contain trade data"
 
-            print(f"✓ Received snapshot with {len(snapshot['data'])} trades")
-
-            # Unsubscribe
-            try:
-                client.unsubscribe(channel="trade", symbol=[TEST_SYMBOL])
-            except Exception as e:
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
-                print(f"⚠ Unsubscribe timeout (acceptable): {e}")
+        print(f"✓ Received snapshot with {len(snapshot['data'])} trades")
 
     def test_trade_snapshot_false(self, default_timeout):
         """
@@ -148,32 +196,21 @@ class TestTradeChannel:
         Should only receive live trade updates, no initial snapshot.
         """
         with KrakenWebSocketClient(WS_URL, timeout=default_timeout) as client:
-            ack = client.subscribe(
-                channel="trade",
-                symbol=[TEST_SYMBOL],
-                snapshot=False
-            )
-            assert ack.get("success") is True
+            with trade_subscription(client, [TEST_SYMBOL], snapshot=False) as ack:
+                assert ack.get("success") is True
 
-            # Wait for messages - should be updates only
-            messages = client.receive_messages(count=2, timeout=default_timeout)
-            assert len(messages) >= 1
+                # Wait for messages - should be updates only
+                messages = client.receive_messages(count=2, timeout=default_timeout)
+                assert len(messages) >= 1
 
-            # All messages should be updates (no snapshot)
-            for msg in messages:
-                assert msg.get("channel") == "trade"
-                # May receive updates or occasionally snapshot
-                assert msg.get("type") in ["snapshot", "update"]
+                # All messages should be updates (no snapshot)
+                for msg in messages:
+                    assert msg.get("channel") == "trade"
+                    # May receive updates or occasionally snapshot
+                    assert msg.get("type") in MESSAGE_TYPES
 
-            # Unsubscribe
-            try:
-                client.unsubscribe(channel="trade", symbol=[TEST_SYMBOL])
-            except Exception as e:
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
-                print(f"⚠ Unsubscribe timeout (acceptable): {e}")
-
-    def test_trade_schema_validation(self, schema, default_timeout):
+    @pytest.mark.xdist_group("trade_feed")
+    def test_trade_schema_validation(self, trade_feed):
         """
         Test that trade messages conform to JSON schema.
 
@@ -182,27 +219,19 @@ class TestTradeChannel:
         - Correct data types
         - Valid enum values (snapshot/update, limit/market)
         """
-        with KrakenWebSocketClient(WS_URL, timeout=default_timeout) as client:
-            client.subscribe(channel="trade", symbol=[TEST_SYMBOL], snapshot=True)
+        messages = trade_feed.messages(3)
+        assert len(messages) > 0
 
-            messages = client.receive_messages(count=3, timeout=default_timeout)
-            assert len(messages) > 0
-
-            for msg in messages:
-                try:
-                    jsonschema.validate(instance=msg, schema=schema)
-                    print(f"✓ Message validates against schema: {msg.get('type')}")
-                except jsonschema.ValidationError as e:
-                    pytest.fail(f"Schema validation failed: {e.message}")
-
-            # Unsubscribe
+        for msg in messages:
             try:
-                client.unsubscribe(channel="trade", symbol=[TEST_SYMBOL])
-            except Exception as e:
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
-
-    def test_trade_data_integrity(self, default_timeout):
+                # Process-wide compiled validator for schemas/trade_schema.json
+                validate_schema(msg, channel="trade")
+            except jsonschema.ValidationError as e:
+                pytest.fail(f"Schema validation failed: {e.message}")
+            print(f"✓ Message validates against schema: {msg.get('type')}")
+
+    @pytest.mark.xdist_group("trade_feed")
+    def test_trade_data_integrity(self, trade_feed):
         """
         Test data integrity constraints for trade messages.
 
@@ -216,120 +245,72 @@ class TestTradeChannel:
         6. symbol matches subscription
         7. timestamp is valid RFC3339 format
         """
-        with KrakenWebSocketClient(WS_URL, timeout=default_timeout) as client:
-            client.subscribe(channel="trade", symbol=[TEST_SYMBOL], snapshot=True)
-
-            messages = client.receive_messages(count=3, timeout=default_timeout)
-            assert len(messages) > 0
-
-            violations = []
-
-            for i, msg in enumerate(messages):
-                print(f"\n  Validating message {i + 1} ({msg.get('type')}):")
-
-                # Check that data array is not empty
-                data = msg.get("data", [])
-                try:
-                    assert len(data) > 0, "Message data array is empty"
-                    print(f"  Message {i + 1}: ✓ Data array not empty ({len(data)} trades)")
-                except AssertionError as e:
-                    violations.append(str(e))
-                    print(f"  Message {i + 1}: ✗ {e}")
-                    continue
-
-                for j, trade in enumerate(data):
-                    print(f"    Trade {j + 1}:")
-
-                    symbol = trade.get("symbol")
-                    side = trade.get("side")
-                    qty = trade.get("qty")
-                    price = trade.get("price")
-                    ord_type = trade.get("ord_type")
-                    trade_id = trade.get("trade_id")
-                    timestamp = trade.get("timestamp")
-
-                    # Required fields are not None
-                    try:
-                        assert symbol is not None, "symbol is None"
-                        assert side is not None, "side is None"
-                        assert qty is not None, "qty is None"
-                        assert price is not None, "price is None"
-                        assert ord_type is not None, "ord_type is None"
-                        assert trade_id is not None, "trade_id is None"
-                        assert timestamp is not None, "timestamp is None"
-                        print(f"      ✓ All required fields present")
-                    except AssertionError as e:
-                        violations.append(str(e))
-                        print(f"      ✗ {e}")
-
-                    # 1. Quantity validation
-                    try:
-                        assert qty > 0, f"qty ({qty}) <= 0"
-                        print(f"      ✓ qty > 0: {qty}")
-                    except (AssertionError, TypeError) as e:
-                        violations.append(str(e))
-                        print(f"      ✗ {e}")
-
-                    # 2. Price validation
-                    try:
-                        assert price > 0, f"price ({price}) <= 0"
-                        print(f"      ✓ price > 0: {price}")
-                    except (AssertionError, TypeError) as e:
-                        violations.append(str(e))
-                        print(f"      ✗ {e}")
-
-                    # 3. Side validation
-                    try:
-                        assert side in ["buy", "sell"], f"side ({side}) not in ['buy', 'sell']"
-                        print(f"      ✓ side valid: {side}")
-                    except AssertionError as e:
-                        violations.append(str(e))
-                        print(f"      ✗ {e}")
-
-                    # 4. Order type validation
-                    try:
-                        assert ord_type in ["limit", "market"], f"ord_type ({ord_type}) not in ['limit', 'market']"
-                        print(f"      ✓ ord_type valid: {ord_type}")
-                    except AssertionError as e:
-                        violations.append(str(e))
-                        print(f"      ✗ {e}")
-
-                    # 5. Trade ID validation
-                    try:
-                        assert isinstance(trade_id, int), f"trade_id ({trade_id}) not integer"
-                        assert trade_id > 0, f"trade_id ({trade_id}) <= 0"
-                        print(f"      ✓ trade_id > 0: {trade_id}")
-                    except (AssertionError, TypeError) as e:
-                        violations.append(str(e))
-                        print(f"      ✗ {e}")
-
-                    # 6. Symbol validation
-                    try:
-                        assert symbol == TEST_SYMBOL, f"symbol ({symbol}) != {TEST_SYMBOL}"
-                        print(f"      ✓ symbol matches: {symbol}")
-                    except AssertionError as e:
-                        violations.append(str(e))
-                        print(f"      ✗ {e}")
-
-                    # 7. Timestamp format validation
-                    try:
-                        from datetime import datetime
-                        datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        print(f"      ✓ timestamp valid RFC3339: {timestamp}")
-                    except Exception as e:
-                        violations.append(f"Invalid timestamp format: {e}")
-                        print(f"      ✗ Invalid timestamp: {e}")
-
-            # Unsubscribe
-            try:
-                client.unsubscribe(channel="trade", symbol=[TEST_SYMBOL])
-            except Exception as e:
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
-
-            # Report violations
-            if violations:
-                pytest.fail(f"Data integrity violations:\n" + "\n".join(violations))
+        messages = trade_feed.messages(3)
+        assert len(messages) > 0
+
+        violations = []
+        trade_count = 0
+        # Per-trade trace only with --log-cli-level=DEBUG
+        trace = log.isEnabledFor(logging.DEBUG)
+
+        for msg in messages:
+            # Check that data array is not empty
+            data = msg.get("data", [])
+            if not data:
+                violations.append("Message data array is empty")
+                continue
+
+            for trade in data:
+                trade_count += 1
+                if trace:
+                    log.debug("trade %s: %s %s @ %s (%s) %s", trade.get("trade_id"), trade.get("side"),
+                              trade.get("qty"), trade.get("price"), trade.get("ord_type"), trade.get("timestamp"))
+
+                # Required fields are present
+                for field in TRADE_FIELDS:
+                    if trade.get(field) is None:
+                        violations.append(f"{field} is None (trade_id {trade.get('trade_id')})")
+
+                # 1./2. Quantity and price (a numeric string or a boolean is a violation, not a number)
+                for field in ("qty", "price"):
+                    value = trade.get(field)
+                    if not isinstance(value, (int, float)) or isinstance(value, bool):
+                        violations.append(f"{field} ({value!r}) not a number")
+                    elif value <= 0:
+                        violations.append(f"{field} ({value}) <= 0")
+
+                # 3. Side validation
+                side = trade.get("side")
+                if not isinstance(side, str) or side not in VALID_SIDES:
+                    violations.append(f"side ({side}) not in {sorted(VALID_SIDES)}")
+
+                # 4. Order type validation
+                ord_type = trade.get("ord_type")
+                if not isinstance(ord_type, str) or ord_type not in VALID_ORD_TYPES:
+                    violations.append(f"ord_type ({ord_type}) not in {sorted(VALID_ORD_TYPES)}")
+
+                # 5. Trade ID validation
+                trade_id = trade.get("trade_id")
+                if not isinstance(trade_id, int) or isinstance(trade_id, bool):
+                    violations.append(f"trade_id ({trade_id}) not integer")
+                elif trade_id <= 0:
+                    violations.append(f"trade_id ({trade_id}) <= 0")
+
+                # 6. Symbol validation
+                symbol = trade.get("symbol")
+                if symbol != TEST_SYMBOL:
+                    violations.append(f"symbol ({symbol}) != {TEST_SYMBOL}")
+
+                # 7. Timestamp format validation
+                timestamp = trade.get("timestamp")
+                if not isinstance(timestamp, str) or TS_RE.match(timestamp) is None:
+                    violations.append(f"Invalid timestamp format: {timestamp!r}")
+
+        print(f"✓ Validated {trade_count} trades, {len(violations)} violations")
+
+        # Report violations
+        if violations:
+            pytest.fail(f"Data integrity violations:\n" + "\n".join(violations))
 
     def test_trade_multiple_symbols(self, default_timeout):
         """
@@ -341,32 +322,24 @@ class TestTradeChannel:
         - All symbols receive updates
         """
         with KrakenWebSocketClient(WS_URL, timeout=default_timeout) as client:
-            ack = client.subscribe(channel="trade", symbol=TEST_SYMBOLS_MULTI, snapshot=True)
-            assert ack.get("success") is True
-
-            # Receive messages
-            messages = client.receive_messages(count=5, timeout=default_timeout)
-            assert len(messages) > 0
+            with trade_subscription(client, TEST_SYMBOLS_MULTI, snapshot=True) as ack:
+                assert ack.get("success") is True
 
-            # Collect symbols from messages
-            symbols_seen = set()
-            for msg in messages:
-                for trade in msg.get("data", []):
-                    symbols_seen.add(trade.get("symbol"))
+                # Receive messages
+                messages = client.receive_messages(count=5, timeout=default_timeout)
+                assert len(messages) > 0
 
-            print(f"✓ Received trades for symbols: {symbols_seen}")
+                # Collect symbols from messages
+                symbols_seen = set()
+                for msg in messages:
+                    for trade in msg.get("data", []):
+                        symbols_seen.add(trade.get("symbol"))
 
-            # Verify at least one of our symbols appeared
-            assert len(symbols_seen.intersection(TEST_SYMBOLS_MULTI)) > 0, \
-                f"No trades for subscribed symbols. Got: {symbols_seen}"
+                print(f"✓ Received trades for symbols: {symbols_seen}")
 
-            # Unsubscribe
-            try:
-                client.unsubscribe(channel="trade", symbol=TEST_SYMBOLS_MULTI)
-            except Exception as e:
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
-                print(f"⚠ Unsubscribe timeout (acceptable): {e}")
+                # Verify at least one of our symbols appeared
+                assert len(symbols_seen.intersection(TEST_SYMBOLS_MULTI)) > 0, \
+                    f"No trades for subscribed symbols. Got: {symbols_seen}"
 
     def test_trade_invalid_symbol(self):
         """Test that subscribing to invalid symbol fails gracefully."""
@@ -374,103 +347,76 @@ class TestTradeChannel:
             with pytest.raises(ValueError, match="Subscription failed"):
                 client.subscribe(channel="trade", symbol=["INVALID/PAIR"])
 
-    def test_trade_trade_id_sequence(self, default_timeout):
+    @pytest.mark.xdist_group("trade_feed")
+    def test_trade_trade_id_sequence(self, trade_feed):
         """
         Test that trade_id values form a sequence.
 
         Note: trade_id is unique per book, but may have gaps or not be strictly
         sequential across different messages. We validate they're all positive integers.
         """
-        with KrakenWebSocketClient(WS_URL, timeout=default_timeout) as client:
-            client.subscribe(channel="trade", symbol=[TEST_SYMBOL], snapshot=True)
+        messages = trade_feed.messages(3)
+        assert len(messages) > 0
 
-            messages = client.receive_messages(count=3, timeout=default_timeout)
-            assert len(messages) > 0
+        all_trade_ids = []
 
-            all_trade_ids = []
+        for msg in messages:
+            for trade in msg.get("data", []):
+                trade_id = trade.get("trade_id")
+                if trade_id is not None:
+                    all_trade_ids.append(trade_id)
 
-            for msg in messages:
-                for trade in msg.get("data", []):
-                    trade_id = trade.get("trade_id")
-                    if trade_id is not None:
-                        all_trade_ids.append(trade_id)
+        assert len(all_trade_ids) > 0, "No trade_ids found"
 
-            assert len(all_trade_ids) > 0, "No trade_ids found"
+        # Verify all are positive integers
+        for tid in all_trade_ids:
+            assert isinstance(tid, int), f"trade_id {tid} is not an integer"
+            assert tid > 0, f"trade_id {tid} is not positive"
 
-            # Verify all are positive integers
-            for tid in all_trade_ids:
-                assert isinstance(tid, int), f"trade_id {tid} is not an integer"
-                assert tid > 0, f"trade_id {tid} is not positive"
+        print(f"✓ All {len(all_trade_ids)} trade_ids are positive integers")
+        print(f"  Range: {min(all_trade_ids)} to {max(all_trade_ids)}")
 
-            print(f"✓ All {len(all_trade_ids)} trade_ids are positive integers")
-            print(f"  Range: {min(all_trade_ids)} to {max(all_trade_ids)}")
-
-            # Unsubscribe
-            try:
-                client.unsubscribe(channel="trade", symbol=[TEST_SYMBOL])
-            except Exception as e:
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
-
-    def test_trade_side_distribution(self, default_timeout):
+    @pytest.mark.xdist_group("trade_feed")
+    def test_trade_side_distribution(self, trade_feed):
         """
         Test that trade messages contain both buy and sell sides.
 
         Note: Depending on market conditions, we may not see both sides,
         but we validate that all sides are valid values.
         """
-        with KrakenWebSocketClient(WS_URL, timeout=default_timeout) as client:
-            client.subscribe(channel="trade", symbol=[TEST_SYMBOL], snapshot=True)
+        messages = trade_feed.messages(5)
+        assert len(messages) > 0
 
-            messages = client.receive_messages(count=5, timeout=default_timeout)
-            assert len(messages) > 0
+        sides_seen = set()
 
-            sides_seen = set()
+        for msg in messages:
+            for trade in msg.get("data", []):
+                side = trade.get("side")
+                if side:
+                    sides_seen.add(side)
+                    assert side in VALID_SIDES, f"Invalid side: {side}"
 
-            for msg in messages:
-                for trade in msg.get("data", []):
-                    side = trade.get("side")
-                    if side:
-                        sides_seen.add(side)
-                        assert side in ["buy", "sell"], f"Invalid side: {side}"
-
-            print(f"✓ Sides observed: {sides_seen}")
-            assert len(sides_seen) > 0, "No sides found in trades"
+        print(f"✓ Sides observed: {sides_seen}")
+        assert len(sides_seen) > 0, "No sides found in trades"
 
-            # Unsubscribe
-            try:
-                client.unsubscribe(channel="trade", symbol=[TEST_SYMBOL])
-            except Exception as e:
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
-
-    def test_trade_order_type_distribution(self, default_timeout):
+    @pytest.mark.xdist_group("trade_feed")
+    def test_trade_order_type_distribution(self, trade_feed):
         """
         Test that trade messages contain valid order types.
 
         Validates all order types are either 'limit' or 'market'.
         """
-        with KrakenWebSocketClient(WS_URL, timeout=default_timeout) as client:
-            client.subscribe(channel="trade", symbol=[TEST_SYMBOL], snapshot=True)
+        messages = trade_feed.messages(5)
+        assert len(messages) > 0
 
-            messages = client.receive_messages(count=5, timeout=default_timeout)
-            assert len(messages) > 0
+        order_types_seen = set()
 
-            order_types_seen = set()
+        for msg in messages:
+            for trade in msg.get("data", []):
+                ord_type = trade.get("ord_type")
+                if ord_type:
+                    order_types_seen.add(ord_type)
+                    assert ord_type in VALID_ORD_TYPES, f"Invalid ord_type: {ord_type}"
 
-            for msg in messages:
-                for trade in msg.get("data", []):
-                    ord_type = trade.get("ord_type")
-                    if ord_type:
-                        order_types_seen.add(ord_type)
-                        assert ord_type in ["limit", "market"], f"Invalid ord_type: {ord_type}"
-
-            print(f"✓ Order types observed: {order_types_seen}")
-            assert len(order_types_seen) > 0, "No order types found in trades"
-
-            # Unsubscribe
-            try:
-                client.unsubscribe(channel="trade", symbol=[TEST_SYMBOL])
-            except Exception as e:
-                if 'timeout' not in str(e).lower() and 'Timeout' not in type(e).__name__:
-                    raise
+        print(f"✓ Order types observed: {order_types_seen}")
+        assert len(order_types_seen) > 0, "No order types found in trades"
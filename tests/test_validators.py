@@ -0,0 +1,229 @@
+"""
+Tests for the numeric validators (utils/validators.py)
+
+These run on plain lists and numpy arrays only, so no connection to Kraken
+is made. Each validator is checked for valid input, empty input, NaN and
+non-numeric values, and the exact error message of every failure.
+"""
+
+import re
+import time
+
+import numpy as np
+import pytest
+
+from utils.validators import (
+    _float_array,
+    validate_book_not_crossed,
+    validate_ohlc_relationships_batch,
+    validate_price_ordering,
+    validate_timestamps,
+    validate_timestamps_increasing,
+)
+
+
+class TestFloatArray:
+    """Conversion to the float64 array the vectorized validators share."""
+
+    def test_converts_numbers_and_numeric_strings(self):
+        """Test that numbers and numeric strings convert to float64."""
+        arr = _float_array([1, "2.5", 3.0], "price")
+        assert arr.dtype == np.float64
+        assert arr.tolist() == [1.0, 2.5, 3.0]
+        print("  ✓ Numbers and numeric strings converted")
+
+    def test_float64_array_passed_through(self):
+        """Test that a float64 array is used as it is, without a copy."""
+        values = np.array([1.0, 2.0])
+        assert _float_array(values, "price") is values
+        print("  ✓ float64 array passed through")
+
+    def test_empty(self):
+        """Test that empty input gives an empty array."""
+        assert _float_array([], "price").size == 0
+        print("  ✓ Empty input accepted")
+
+    @pytest.mark.parametrize("values, message", [
+        pytest.param([1, "abc"], "Invalid price: abc - could not convert string to float: 'abc'", id="string"),
+        pytest.param([1, [2]], "Invalid price: [2] - float() argument must be a string or a real number, not 'list'",
+                     id="list"),
+        pytest.param([1, float("nan")], "Invalid price: nan - not a number (index 1)", id="nan"),
+        pytest.param([1, None], "Invalid price: None - not a number (index 1)", id="none"),
+        pytest.param(np.array([1.0, np.nan]), "Invalid price: nan - not a number (index 1)", id="ndarray_nan"),
+    ])
+    def test_rejects_non_numbers(self, values, message):
+        """Test that the first non-number is named in the error."""
+        with pytest.raises(ValueError, match=re.escape(message)):
+            _float_array(values, "price")
+        print(f"  ✓ Rejected: {message}")
+
+
+class TestTimestampValidators:
+    """validate_timestamps_increasing and validate_timestamps."""
+
+    @pytest.mark.parametrize("timestamps", [
+        pytest.param([1.0, 2.0, 3.0], id="list"),
+        pytest.param(["1.5", "2.5"], id="strings"),
+        pytest.param(np.array([1.0, 2.0, 3.0]), id="ndarray"),
+        pytest.param([1.0], id="single"),
+        pytest.param([], id="empty"),
+    ])
+    def test_valid(self, timestamps):
+        """Test that increasing series pass both validators."""
+        assert validate_timestamps_increasing(timestamps) is True
+        assert validate_timestamps(timestamps) is True
+        print(f"  ✓ Accepted {len(timestamps)} timestamps")
+
+    @pytest.mark.parametrize("timestamps, message", [
+        pytest.param([1.0, 3.0, 2.0], "Timestamps not strictly increasing: 3.0 >= 2.0 at index 2", id="decreasing"),
+        pytest.param([1.0, 1.0], "Timestamps not strictly increasing: 1.0 >= 1.0 at index 1", id="equal"),
+        pytest.param(["1", "x"], "Invalid timestamp: x - could not convert string to float: 'x'", id="string"),
+        pytest.param([1.0, float("nan"), 0.5], "Invalid timestamp: nan - not a number (index 1)", id="nan"),
+    ])
+    def test_invalid(self, timestamps, message):
+        """Test the error for out-of-order and non-numeric series, from both validators."""
+        for validator in (validate_timestamps_increasing, validate_timestamps):
+            with pytest.raises(ValueError, match=re.escape(message)):
+                validator(timestamps)
+        print(f"  ✓ Rejected: {message}")
+
+    def test_not_positive(self):
+        """Test that validate_timestamps rejects zero and negative values by index."""
+        with pytest.raises(ValueError, match=re.escape(
+                "Invalid timestamp: 0 - Timestamp must be positive: 0.0 (index 1)")):
+            validate_timestamps([1, 0, 2])
+        with pytest.raises(ValueError, match=re.escape("Timestamp must be positive: -1.0 (index 0)")):
+            validate_timestamps([-1, 1])
+        print("  ✓ Non-positive timestamp rejected")
+
+    def test_value_checked_before_order(self):
+        """Test that a bad value is reported ahead of an earlier ordering failure."""
+        with pytest.raises(ValueError, match=re.escape("Timestamp must be positive: -5.0 (index 2)")):
+            validate_timestamps([2.0, 1.0, -5.0])
+        print("  ✓ Value failure reported first")
+
+    def test_future(self):
+        """Test that future timestamps fail unless allow_future is set."""
+        future = time.time() + 3600
+
+        with pytest.raises(ValueError, match=re.escape(
+                f"Invalid timestamp: {future} - Timestamp is too far in future: {future} (index 1)")):
+            validate_timestamps([1.0, future])
+        assert validate_timestamps([1.0, future], allow_future=True) is True
+        # Within the 60 second clock skew allowance
+        assert validate_timestamps([1.0, time.time() + 30]) is True
+        print("  ✓ Future timestamps handled")
+
+
+class TestPriceOrdering:
+    """validate_price_ordering on lists and ndarrays."""
+
+    @pytest.mark.parametrize("prices, descending", [
+        pytest.param([3.0, 2.0, 1.0], True, id="bids"),
+        pytest.param([1.0, 2.0, 3.0], False, id="asks"),
+        pytest.param(["3", "2", "2"], True, id="strings_with_tie"),
+        pytest.param(np.array([3.0, 2.0, 1.0]), True, id="ndarray"),
+        pytest.param(np.array([[3.0, 0.5], [2.0, 1.5]]), True, id="ndarray_2d"),
+        pytest.param(np.empty((0, 2)), True, id="ndarray_2d_empty"),
+        pytest.param([], True, id="empty"),
+    ])
+    def test_valid(self, prices, descending):
+        """Test correctly ordered prices, including (levels, fields) arrays."""
+        assert validate_price_ordering(prices, descending=descending) is True
+        print(f"  ✓ Accepted {len(prices)} prices")
+
+    @pytest.mark.parametrize("prices, descending, message", [
+        pytest.param([3.0, 4.0], True, "Prices not in descending order: 3.0 < 4.0 at index 1", id="bids"),
+        pytest.param([1.0, 2.0, 1.5], False, "Prices not in ascending order: 2.0 > 1.5 at index 2", id="asks"),
+        pytest.param(np.array([[3.0, 0.5], [4.0, 1.5]]), True,
+                     "Prices not in descending order: 3.0 < 4.0 at index 1", id="ndarray_2d"),
+        pytest.param([3.0, "abc"], True, "Invalid price: abc - could not convert string to float: 'abc'",
+                     id="string"),
+        pytest.param([3.0, float("nan"), 1.0], True, "Invalid price: nan - not a number (index 1)", id="nan"),
+    ])
+    def test_invalid(self, prices, descending, message):
+        """Test the error for misordered and non-numeric prices."""
+        with pytest.raises(ValueError, match=re.escape(message)):
+            validate_price_ordering(prices, descending=descending)
+        print(f"  ✓ Rejected: {message}")
+
+
+class TestBookNotCrossed:
+    """validate_book_not_crossed with lists, ndarrays and a mix of both."""
+
+    BIDS = [["100.0", "1.0"], ["99.0", "2.0"]]
+    ASKS = [["101.0", "1.0"], ["102.0", "2.0"]]
+
+    @pytest.mark.parametrize("bids, asks", [
+        pytest.param(BIDS, ASKS, id="lists"),
+        pytest.param(np.array(BIDS, dtype=float), np.array(ASKS, dtype=float), id="ndarrays"),
+        pytest.param(np.array([100.0, 99.0]), np.array([101.0, 102.0]), id="price_columns"),
+        pytest.param(np.array(BIDS, dtype=float), ASKS, id="ndarray_and_list"),
+        pytest.param(BIDS, np.array(ASKS, dtype=float), id="list_and_ndarray"),
+        pytest.param([], ASKS, id="empty_bids"),
+        pytest.param(np.array(BIDS, dtype=float), [], id="ndarray_and_empty_list"),
+        pytest.param(np.empty((0, 2)), np.empty((0, 2)), id="empty_ndarrays"),
+    ])
+    def test_not_crossed(self, bids, asks):
+        """Test books whose best bid is below the best ask, or with an empty side."""
+        assert validate_book_not_crossed(bids, asks) is True
+        print("  ✓ Book not crossed")
+
+    @pytest.mark.parametrize("bids, asks", [
+        pytest.param([["101.0", "1.0"]], [["101.0", "1.0"]], id="lists"),
+        pytest.param(np.array([[101.0, 1.0]]), [["101.0", "1.0"]], id="ndarray_and_list"),
+        pytest.param([["101.0", "1.0"]], np.array([[101.0, 1.0]]), id="list_and_ndarray"),
+    ])
+    def test_crossed(self, bids, asks):
+        """Test that a best bid at or above the best ask is rejected."""
+        with pytest.raises(ValueError, match=re.escape("Order book is crossed: best_bid=101.0 >= best_ask=101.0")):
+            validate_book_not_crossed(bids, asks)
+        print("  ✓ Crossed book rejected")
+
+
+class TestOhlcBatch:
+    """validate_ohlc_relationships_batch over arrays of candles."""
+
+    def test_valid(self):
+        """Test valid candles given as lists of strings and as arrays."""
+        assert validate_ohlc_relationships_batch(["10", "11"], ["12", "11"], ["9", "10"], ["11", "10.5"]) is True
+        assert validate_ohlc_relationships_batch(
+            np.array([10.0]), np.array([12.0]), np.array([9.0]), np.array([11.0])) is True
+        assert validate_ohlc_relationships_batch([], [], [], []) is True
+        print("  ✓ Valid candles accepted")
+
+    @pytest.mark.parametrize("candle, message", [
+        pytest.param((10.0, 12.0, 10.5, 11.0), "Candle 1: Low (10.5) > Open (10.0)", id="low_above_open"),
+        pytest.param((10.0, 12.0, 9.0, 8.0), "Candle 1: Low (9.0) > Close (8.0)", id="low_above_close"),
+        pytest.param((10.0, 9.5, 9.0, 9.2), "Candle 1: High (9.5) < Open (10.0)", id="high_below_open"),
+        pytest.param((10.0, 11.0, 9.0, 12.0), "Candle 1: High (11.0) < Close (12.0)", id="high_below_close"),
+    ])
+    def test_invalid(self, candle, message):
+        """Test that the first bad candle is named with the failed relationship."""
+        good = (10.0, 12.0, 9.0, 11.0)
+        o, h, lo, c = zip(good, candle, good)
+
+        with pytest.raises(ValueError, match=re.escape(message)):
+            validate_ohlc_relationships_batch(o, h, lo, c)
+        print(f"  ✓ Rejected: {message}")
+
+    @pytest.mark.parametrize("field, message", [
+        pytest.param(0, "Invalid open price: abc - could not convert string to float: 'abc'", id="open"),
+        pytest.param(1, "Invalid high price: abc - could not convert string to float: 'abc'", id="high"),
+        pytest.param(2, "Invalid low price: abc - could not convert string to float: 'abc'", id="low"),
+        pytest.param(3, "Invalid close price: abc - could not convert string to float: 'abc'", id="close"),
+    ])
+    def test_non_numeric(self, field, message):
+        """Test that a non-numeric price names its field."""
+        columns = [["10"], ["12"], ["9"], ["11"]]
+        columns[field] = ["abc"]
+
+        with pytest.raises(ValueError, match=re.escape(message)):
+            validate_ohlc_relationships_batch(*columns)
+        print(f"  ✓ Rejected: {message}")
+
+    def test_nan(self):
+        """Test that NaN, which passes every comparison, is rejected."""
+        with pytest.raises(ValueError, match=re.escape("Invalid high price: nan - not a number (index 0)")):
+            validate_ohlc_relationships_batch([10.0], [float("nan")], [9.0], [11.0])
+        print("  ✓ NaN rejected")
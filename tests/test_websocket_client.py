@@ -0,0 +1,96 @@
+"""
+Tests for KrakenWebSocketClient against a local websockets server
+
+The server runs in a background thread and acknowledges each symbol of a
+subscribe request separately, tagged with the request's req_id, the way
+Kraken's v2 API does. No network access to Kraken is needed.
+"""
+
+import json
+import threading
+import pytest
+
+from websockets.sync.server import serve
+
+from utils.websocket_client import KrakenWebSocketClient
+
+# Pair the fake server rejects, like Kraken does for unknown pairs
+INVALID_SYMBOL = "INVALID/PAIR"
+
+
+class FakeKraken:
+    """Minimal v2 endpoint for subscribe requests; every request it receives is kept in self.requests."""
+
+    def __init__(self):
+        self.requests = []
+        self.url = None
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        self._server = serve(self._handle, "127.0.0.1", 0)
+        port = self._server.socket.getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._server.shutdown()
+        self._thread.join()
+        return False
+
+    def _handle(self, ws):
+        for frame in ws:
+            request = json.loads(frame)
+            self.requests.append(request)
+            params = request["params"]
+
+            # One ack per symbol, with a heartbeat and a data message in between
+            for symbol in params["symbol"]:
+                if symbol == INVALID_SYMBOL:
+                    ack = {"method": "subscribe", "req_id": request["req_id"], "success": False,
+                           "symbol": symbol, "error": f"Currency pair not supported {symbol}"}
+                else:
+                    ack = {"method": "subscribe", "req_id": request["req_id"], "success": True,
+                           "result": {"channel": params["channel"], "symbol": symbol}}
+                ws.send(json.dumps(ack))
+                ws.send(json.dumps({"channel": "heartbeat"}))
+                ws.send(json.dumps({"channel": params["channel"], "type": "snapshot",
+                                    "data": [{"symbol": symbol}]}))
+
+
+class TestSubscribeMany:
+    """KrakenWebSocketClient.subscribe_many() request merging and ack collection."""
+
+    def test_every_symbol_acknowledged(self):
+        """Test that all per-symbol acks are collected, grouped by request in send order."""
+        print("\n[SYNC CLIENT] Testing subscribe_many ack collection...")
+
+        with FakeKraken() as server:
+            with KrakenWebSocketClient(server.url, timeout=5) as client:
+                acks = client.subscribe_many([
+                    ("ticker", ["BTC/USD", "ETH/USD"], {}),
+                    ("book", ["BTC/USD"], {"depth": 10}),
+                    ("ticker", ["SOL/USD", "BTC/USD"], {}),
+                ])
+
+        # Items with the same channel and options share a request
+        assert [(r["req_id"], r["params"]) for r in server.requests] == [
+            (1, {"channel": "ticker", "symbol": ["BTC/USD", "ETH/USD", "SOL/USD"]}),
+            (2, {"channel": "book", "symbol": ["BTC/USD"], "depth": 10}),
+        ]
+        assert [(ack["req_id"], ack["result"]["symbol"]) for ack in acks] == [
+            (1, "BTC/USD"), (1, "ETH/USD"), (1, "SOL/USD"), (2, "BTC/USD"),
+        ]
+        print(f"  ✓ Collected {len(acks)} acks for {len(server.requests)} requests")
+
+    def test_rejected_symbol(self):
+        """Test that an error ack for one symbol raises ValueError once its request is accounted for."""
+        print("\n[SYNC CLIENT] Testing subscribe_many with a rejected symbol...")
+
+        with FakeKraken() as server:
+            with KrakenWebSocketClient(server.url, timeout=5) as client:
+                with pytest.raises(ValueError, match=f"Currency pair not supported {INVALID_SYMBOL}"):
+                    client.subscribe_many([("ticker", ["BTC/USD", INVALID_SYMBOL], {})])
+        print("  ✓ Error ack raised ValueError")
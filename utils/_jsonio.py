@@ -0,0 +1,32 @@
+"""
+JSON encode/decode shared by the utils modules.
+
+Uses orjson when installed and falls back to the stdlib json module.
+Encoders return bytes so callers can write them straight to binary files.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Compact JSON encoding."""
+        return orjson.dumps(obj)
+
+    def dumps_pretty(obj: Any) -> bytes:
+        """JSON encoding indented by 2 spaces."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Compact JSON encoding."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def dumps_pretty(obj: Any) -> bytes:
+        """JSON encoding indented by 2 spaces."""
+        return json.dumps(obj, indent=2).encode()
@@ -0,0 +1,268 @@
+import asyncio
+from typing import Any, AsyncIterator, Coroutine, Dict, List, Optional, Sequence
+
+from websockets.asyncio.client import ClientConnection, connect
+
+# Same payload encoding (and cache) and frame decoding as the sync client
+from ._jsonio import loads
+from .websocket_client import _build_request, _is_data_message
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (not available on Windows)
+    uvloop = None
+
+
+def run(coro: Coroutine) -> Any:
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+
+    Args:
+        coro: Coroutine to run (e.g. a function using AsyncKrakenWebSocketClient)
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+async def gather_messages(clients: Sequence["AsyncKrakenWebSocketClient"], count: int = 10,
+                          timeout: Optional[float] = None) -> List[List[Dict]]:
+    """
+    Receive data messages from several clients concurrently.
+
+    All sockets are served by the one event loop, so the wait for N
+    subscriptions costs about as long as the slowest one instead of the sum.
+
+    Args:
+        clients: Connected, subscribed clients
+        count: Number of messages to receive from each client
+        timeout: Timeout for each client's receive_messages()
+
+    Returns:
+        One list of parsed messages per client, in the order of clients
+    """
+    return list(await asyncio.gather(*(client.receive_messages(count, timeout) for client in clients)))
+
+
+class AsyncKrakenWebSocketClient:
+    """
+    asyncio WebSocket client for Kraken API v2 with built-in validation.
+
+    Mirrors KrakenWebSocketClient, but every network operation is a
+    coroutine, so receives on several clients can be overlapped with
+    asyncio.gather() on a single event loop.
+    """
+
+    def __init__(self, url: str, timeout: int = 30):
+        """
+        Initialize WebSocket client.
+
+        Args:
+            url: WebSocket endpoint URL
+            timeout: Timeout for operations in seconds
+        """
+        self.url = url
+        self.timeout = timeout
+        self.ws: Optional[ClientConnection] = None
+
+    async def connect(self) -> None:
+        """Establish WebSocket connection."""
+        # Kraken streams its own heartbeat channel, so the library's keepalive
+        # pings are disabled (no background ping task per connection)
+        self.ws = await connect(self.url, open_timeout=self.timeout, ping_interval=None)
+
+    async def disconnect(self) -> None:
+        """Close WebSocket connection."""
+        if self.ws:
+            await self.ws.close()
+            self.ws = None
+
+    async def subscribe(self, channel: str, symbol: List[str], **options) -> Dict:
+        """
+        Subscribe to a channel and validate acknowledgment (WebSocket v2 API).
+
+        Args:
+            channel: Channel name (e.g., 'ticker', 'book', 'ohlc', 'trade')
+            symbol: List of currency pairs (e.g., ['BTC/USD'])
+            **options: Additional subscription options (e.g., depth=10, interval=1)
+
+        Returns:
+            Subscription acknowledgment message
+
+        Raises:
+            ValueError: If subscription fails or acknowledgment is invalid
+        """
+        if not self.ws:
+            raise RuntimeError("Not connected. Call connect() first.")
+
+        # text=True: the encoded bytes go out as a text frame, like websocket-client sends them
+        await self.ws.send(_build_request("subscribe", channel, symbol, options), text=True)
+
+        ack = await self._wait_for_method("subscribe")
+
+        if not ack.get("success"):
+            error = ack.get("error", "Unknown error")
+            raise ValueError(f"Subscription failed: {error}")
+
+        return ack
+
+    async def unsubscribe(self, channel: str, symbol: List[str], **options) -> Dict:
+        """
+        Unsubscribe from a channel (WebSocket v2 API).
+
+        Args:
+            channel: Channel name
+            symbol: List of currency pairs
+            **options: Additional subscription options
+
+        Returns:
+            Unsubscription acknowledgment message
+        """
+        if not self.ws:
+            raise RuntimeError("Not connected. Call connect() first.")
+
+        await self.ws.send(_build_request("unsubscribe", channel, symbol, options), text=True)
+
+        return await self._wait_for_method("unsubscribe")
+
+    async def _wait_for_method(self, method: str, timeout: Optional[float] = None) -> Dict:
+        """
+        Wait for a specific method response (v2 API).
+
+        Args:
+            method: Method name to wait for (e.g., 'subscribe', 'unsubscribe')
+            timeout: Optional timeout override
+
+        Returns:
+            Method response message
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or self.timeout)
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError(f"Timeout waiting for method: {method}")
+
+            msg = await self.receive_message(timeout=remaining)
+
+            if isinstance(msg, dict) and msg.get("method") == method:
+                return msg
+
+    async def receive_message(self, timeout: Optional[float] = None) -> Dict:
+        """
+        Receive a single message from WebSocket.
+
+        Args:
+            timeout: Optional timeout override
+
+        Returns:
+            Parsed JSON message
+
+        Raises:
+            TimeoutError: If no message arrives within the timeout
+        """
+        if not self.ws:
+            raise RuntimeError("Not connected. Call connect() first.")
+
+        # decode=False hands the frame over as bytes; loads parses them without a str copy
+        data = await asyncio.wait_for(self.ws.recv(decode=False), timeout or self.timeout)
+        return loads(data)
+
+    async def receive_data_message(self, timeout: Optional[float] = None) -> Dict:
+        """
+        Receive the next channel data message, skipping heartbeats, status and acks.
+
+        Args:
+            timeout: Optional timeout override
+
+        Returns:
+            Parsed data message
+
+        Raises:
+            TimeoutError: If no data message arrives within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or self.timeout)
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError("Timeout waiting for data message")
+
+            msg = await self.receive_message(timeout=remaining)
+            if _is_data_message(msg):
+                return msg
+
+    async def iter_messages(self, timeout: Optional[float] = None) -> AsyncIterator[Dict]:
+        """
+        Yield data messages as they arrive, until the caller stops iterating.
+
+        Usage:
+            async for msg in client.iter_messages():
+                ...
+
+        Args:
+            timeout: Longest wait for each data message
+
+        Yields:
+            Parsed data messages
+
+        Raises:
+            TimeoutError: If no data message arrives within the timeout
+        """
+        while True:
+            yield await self.receive_data_message(timeout)
+
+    async def receive_messages(self, count: int = 10, timeout: Optional[float] = None) -> List[Dict]:
+        """
+        Receive multiple data messages (heartbeats, status and acks are skipped).
+
+        Args:
+            count: Number of messages to receive
+            timeout: Timeout for entire operation
+
+        Returns:
+            List of parsed messages (fewer than count only if the connection
+            fails after at least one message)
+
+        Raises:
+            TimeoutError: If fewer than count messages arrive within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or self.timeout)
+        messages = []
+
+        while len(messages) < count:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError(f"Timeout receiving messages. Got {len(messages)}/{count}")
+
+            try:
+                msg = await self.receive_message(timeout=remaining)
+            except TimeoutError:
+                # A short read is an error, not a partial result
+                raise TimeoutError(f"Timeout receiving messages. Got {len(messages)}/{count}") from None
+            except Exception:
+                if messages:
+                    # Got some messages, return what we have
+                    break
+                raise
+
+            if _is_data_message(msg):
+                messages.append(msg)
+
+        return messages
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit with cleanup."""
+        await self.disconnect()
+        return False
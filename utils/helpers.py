@@ -1,9 +1,37 @@
-import json
-from typing import Dict, List, Any, Optional
+import sys
+from collections import Counter
+from typing import Dict, List, Any, NamedTuple, Optional
 from pathlib import Path
 
+import numpy as np
 
-def parse_channel_message(message: Any) -> Optional[Dict]:
+from ._jsonio import dumps_pretty, loads
+
+# Longest side/order_type value a trade row holds; longer values are rejected
+# rather than silently truncated by numpy
+_TRADE_CODE_WIDTH = 6
+
+# One row per trade; price/volume/time are contiguous float64 columns
+TRADE_DTYPE = np.dtype([
+    ("price", "f8"),
+    ("volume", "f8"),
+    ("time", "f8"),
+    ("side", f"U{_TRADE_CODE_WIDTH}"),  # 'b'/'s' (v1) or 'buy'/'sell' (v2)
+    ("order_type", f"U{_TRADE_CODE_WIDTH}"),  # 'l'/'m' (v1) or 'limit'/'market' (v2)
+    ("misc", "O"),
+])
+
+
+class ChannelMessage(NamedTuple):
+    """Channel data message: [channelID, data, channelName, pair] plus the channel prefix."""
+    channel_id: int
+    data: Any
+    channel_name: str
+    pair: str
+    channel_prefix: str  # 'book-10' -> 'book'; computed once by parse_channel_message
+
+
+def parse_channel_message(message: Any) -> Optional[ChannelMessage]:
     """
     Parse channel data message.
 
@@ -13,18 +41,18 @@ def parse_channel_message(message: Any) -> Optional[Dict]:
         message: Raw message from WebSocket
 
     Returns:
-        Parsed message dict or None if not a channel message
+        ChannelMessage or None if not a channel message
     """
     if isinstance(message, list) and len(message) >= 4:
-        return {
-            "channel_id": message[0],
-            "data": message[1],
-            "channel_name": message[2],
-            "pair": message[3]
-        }
+        return ChannelMessage(*message[:4], _channel_prefix(message[2]))
     return None
 
 
+def _channel_prefix(channel_name: Any) -> str:
+    """Channel name without its '-<param>' suffix (e.g. 'ohlc-5' -> 'ohlc')."""
+    return channel_name.split("-", 1)[0] if isinstance(channel_name, str) else ""
+
+
 def is_system_message(message: Any) -> bool:
     """
     Check if message is a system/event message.
@@ -38,20 +66,34 @@ def is_system_message(message: Any) -> bool:
     return isinstance(message, dict) and "event" in message
 
 
-def extract_ticker_data(message: Dict) -> Optional[Dict]:
+def count_message_types(messages: List[Dict]) -> Counter:
+    """
+    Count messages by their 'type' field in a single pass.
+
+    Args:
+        messages: Channel data messages (v2 API)
+
+    Returns:
+        Counter keyed by type (e.g. counts['snapshot'], counts['update']);
+        missing types count as 0
+    """
+    return Counter(msg.get("type") for msg in messages)
+
+
+def extract_ticker_data(message: ChannelMessage) -> Optional[Dict]:
     """
     Extract ticker data from channel message.
 
     Args:
-        message: Parsed channel message
+        message: ChannelMessage from parse_channel_message
 
     Returns:
         Ticker data dict or None
     """
-    if message.get("channel_name") != "ticker":
+    if message.channel_name != "ticker":
         return None
 
-    data = message.get("data", {})
+    data = message.data or {}
     return {
         "ask": data.get("a", []),
         "bid": data.get("b", []),
@@ -65,21 +107,20 @@ def extract_ticker_data(message: Dict) -> Optional[Dict]:
     }
 
 
-def extract_book_data(message: Dict) -> Optional[Dict]:
+def extract_book_data(message: ChannelMessage) -> Optional[Dict]:
     """
     Extract order book data from channel message.
 
     Args:
-        message: Parsed channel message
+        message: ChannelMessage from parse_channel_message
 
     Returns:
         Book data dict or None
     """
-    channel_name = message.get("channel_name", "")
-    if not channel_name.startswith("book"):
+    if message.channel_prefix != "book":
         return None
 
-    data = message.get("data", {})
+    data = message.data or {}
 
     # Handle snapshot vs update
     if "as" in data and "bs" in data:
@@ -98,21 +139,20 @@ def extract_book_data(message: Dict) -> Optional[Dict]:
         }
 
 
-def extract_ohlc_data(message: Dict) -> Optional[Dict]:
+def extract_ohlc_data(message: ChannelMessage) -> Optional[Dict]:
     """
     Extract OHLC/candles data from channel message.
 
     Args:
-        message: Parsed channel message
+        message: ChannelMessage from parse_channel_message
 
     Returns:
         OHLC data dict or None
     """
-    channel_name = message.get("channel_name", "")
-    if not channel_name.startswith("ohlc"):
+    if message.channel_prefix != "ohlc":
         return None
 
-    data = message.get("data", [])
+    data = message.data or []
     if len(data) >= 8:
         return {
             "time": float(data[0]),
@@ -128,35 +168,38 @@ def extract_ohlc_data(message: Dict) -> Optional[Dict]:
     return None
 
 
-def extract_trades_data(message: Dict) -> Optional[List[Dict]]:
+def extract_trades_data(message: ChannelMessage) -> Optional[np.ndarray]:
     """
     Extract trades data from channel message.
 
     Args:
-        message: Parsed channel message
+        message: ChannelMessage from parse_channel_message
 
     Returns:
-        List of trade dicts or None
+        Structured array of TRADE_DTYPE (one row per trade) or None
+
+    Raises:
+        ValueError: If a trade's side or order type is too long for TRADE_DTYPE
+            (numpy would silently truncate it)
     """
-    channel_name = message.get("channel_name", "")
-    if not channel_name.startswith("trade"):
+    if message.channel_prefix != "trade":
         return None
 
-    data = message.get("data", [])
-    trades = []
-
+    data = message.data or []
     for trade in data:
-        if len(trade) >= 6:
-            trades.append({
-                "price": float(trade[0]),
-                "volume": float(trade[1]),
-                "time": float(trade[2]),
-                "side": trade[3],  # 'b' for buy, 's' for sell
-                "order_type": trade[4],  # 'l' for limit, 'm' for market
-                "misc": trade[5]
-            })
+        if len(trade) >= 6 and (len(trade[3]) > _TRADE_CODE_WIDTH or len(trade[4]) > _TRADE_CODE_WIDTH):
+            raise ValueError(f"Trade side/order type longer than {_TRADE_CODE_WIDTH} characters: {trade}")
 
-    return trades if trades else None
+    # side/order_type are packed into fixed-width fields; misc stays a Python
+    # object, so intern it to keep one copy of each repeated value (mostly '')
+    trades = [
+        (float(trade[0]), float(trade[1]), float(trade[2]), trade[3], trade[4],
+         sys.intern(trade[5]) if isinstance(trade[5], str) else trade[5])
+        for trade in data
+        if len(trade) >= 6
+    ]
+
+    return np.array(trades, dtype=TRADE_DTYPE) if trades else None
 
 
 def save_message_to_fixture(message: Any, filename: str, fixtures_dir: str = "fixtures") -> None:
@@ -171,9 +214,22 @@ def save_message_to_fixture(message: Any, filename: str, fixtures_dir: str = "fi
     fixtures_path = Path(fixtures_dir)
     fixtures_path.mkdir(exist_ok=True)
 
-    filepath = fixtures_path / filename
-    with open(filepath, 'w') as f:
-        json.dump(message, f, indent=2)
+    (fixtures_path / filename).write_bytes(dumps_pretty(message))
+
+
+def save_bytes_to_fixture(raw: bytes, filename: str, fixtures_dir: str = "fixtures") -> None:
+    """
+    Save an already-encoded message (e.g. a raw WebSocket frame) as-is.
+
+    Args:
+        raw: JSON payload bytes
+        filename: Filename (without path)
+        fixtures_dir: Fixtures directory path
+    """
+    fixtures_path = Path(fixtures_dir)
+    fixtures_path.mkdir(exist_ok=True)
+
+    (fixtures_path / filename).write_bytes(raw)
 
 
 def load_message_from_fixture(filename: str, fixtures_dir: str = "fixtures") -> Any:
@@ -187,6 +243,29 @@ def load_message_from_fixture(filename: str, fixtures_dir: str = "fixtures") ->
     Returns:
         Loaded message
     """
-    filepath = Path(fixtures_dir) / filename
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    return loads((Path(fixtures_dir) / filename).read_bytes())
+
+
+# Extractor per channel prefix, used by extract()
+_EXTRACTORS = {
+    "ticker": extract_ticker_data,
+    "book": extract_book_data,
+    "ohlc": extract_ohlc_data,
+    "trade": extract_trades_data,
+}
+
+
+def extract(message: ChannelMessage) -> Any:
+    """
+    Extract channel data with the extractor matching the message's channel.
+
+    One dict lookup replaces trying each extract_* function in turn.
+
+    Args:
+        message: ChannelMessage from parse_channel_message
+
+    Returns:
+        The matching extractor's result, or None for unknown channels
+    """
+    extractor = _EXTRACTORS.get(message.channel_prefix)
+    return extractor(message) if extractor is not None else None
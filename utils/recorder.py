@@ -5,31 +5,156 @@ Optional recording utility for capturing live WebSocket messages.
 This utility connects to Kraken WebSocket API and records sample messages
 to the fixtures/ directory for future replay and deterministic testing.
 
-Usage:
+Each run writes the subscription ack to <channel>_<pair>_subscription_<timestamp>.json
+and the recorded frames, as received, to <channel>_<pair>_messages_<timestamp>.jsonl
+(one frame per line). record_messages() returns the number of frames written.
+
+Usage (from the repository root; run it as a module, since it imports
+from the utils package - `python utils/recorder.py` does not work):
+    python -m utils.recorder --help
     python -m utils.recorder --channel ticker --pair BTC/USD --count 10
     python -m utils.recorder --channel book --pair ETH/USD --count 5 --depth 10
 """
 
 import argparse
-import json
+import queue
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
-from websocket_client import KrakenWebSocketClient
+from typing import Any, List, Optional, Union
+
+from ._jsonio import dumps_pretty, loads
+from .websocket_client import KrakenWebSocketClient
+
+# Messages buffered before each append to the JSONL file
+FLUSH_EVERY = 1000
+# Progress line cadence while receiving
+PROGRESS_EVERY = 100
+# Batches allowed to wait for the writer (~10,000 messages), so a slow disk
+# cannot grow memory without bound during bursts
+MAX_PENDING_BATCHES = 10
+# Seconds the receive loop waits for room in a full queue; a batch is only
+# dropped (and reported) if the writer stays that far behind for this long
+SUBMIT_TIMEOUT = 5
+# Event messages that are not recorded
+_SKIP_EVENTS = frozenset(("heartbeat", "systemStatus"))
+# _frame_event() result for frames that are not valid JSON; they are skipped
+_MALFORMED = object()
+
+try:
+    import msgspec
+
+    class _Envelope(msgspec.Struct):
+        """The only field the recorder reads; all other fields are skipped while decoding."""
+        event: Optional[str] = None
+
+    # Event/ack objects decode to _Envelope; channel data arrays stay undecoded
+    _decode_envelope = msgspec.json.Decoder(Union[_Envelope, List[msgspec.Raw]]).decode
+
+    def _frame_event(raw: Union[str, bytes]) -> Any:
+        """Return the frame's 'event' field, None for channel data, or _MALFORMED."""
+        try:
+            envelope = _decode_envelope(raw)
+        except msgspec.ValidationError:
+            # Valid JSON of another shape (a scalar, a non-string 'event'): not an event frame
+            return None
+        except msgspec.DecodeError:
+            return _MALFORMED
+        return envelope.event if isinstance(envelope, _Envelope) else None
+except ImportError:  # msgspec is optional; fall back to a full decode
+    def _frame_event(raw: Union[str, bytes]) -> Any:
+        """Return the frame's 'event' field, None for channel data, or _MALFORMED."""
+        try:
+            msg = loads(raw)
+        except ValueError:
+            return _MALFORMED
+        event = msg.get("event") if isinstance(msg, dict) else None
+        # Like the msgspec envelope: a non-string 'event' is not an event frame
+        return event if isinstance(event, str) else None
+
+
+def _append_jsonl(path: Path, lines: list) -> None:
+    """Append encoded JSON lines (bytes, no trailing newline) to a JSONL file with a single write."""
+    with open(path, 'ab') as f:
+        f.write(b"".join(line + b"\n" for line in lines))
+
+
+class _JsonlWriter(threading.Thread):
+    """Appends batches of encoded messages to a JSONL file so disk writes overlap the receive loop."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize writer thread (call start() to run it).
 
+        Args:
+            path: JSONL file the batches are appended to
+        """
+        super().__init__(name="jsonl-writer", daemon=True)
+        self.path = path
+        self._batches: queue.Queue = queue.Queue(maxsize=MAX_PENDING_BATCHES)
+        self._error: Optional[BaseException] = None
+        self.dropped = 0
 
-def record_messages(channel: str, pair: str, count: int = 10, **options):
+    def submit(self, batch: list) -> None:
+        """
+        Queue a batch for writing.
+
+        The caller must not reuse the list. If the writer is MAX_PENDING_BATCHES
+        behind, the receive loop waits up to SUBMIT_TIMEOUT seconds for room;
+        only then is the batch dropped, reported and counted in self.dropped.
+        """
+        try:
+            self._batches.put(batch, timeout=SUBMIT_TIMEOUT)
+        except queue.Full:
+            self.dropped += len(batch)
+            print(f"\nWARNING: writer still {MAX_PENDING_BATCHES} batches behind after {SUBMIT_TIMEOUT}s, "
+                  f"dropped {len(batch)} messages ({self.dropped} so far)")
+
+    def close(self) -> None:
+        """
+        Write all queued batches and stop the thread.
+
+        Raises:
+            Exception: The error that stopped the writer, if any
+        """
+        self._batches.put(None)
+        self.join()
+        if self._error is not None:
+            raise self._error
+
+    def run(self) -> None:
+        while (batch := self._batches.get()) is not None:
+            if self._error is None:
+                try:
+                    _append_jsonl(self.path, batch)
+                except Exception as e:
+                    self._error = e
+
+
+def record_messages(channel: str, pair: str, count: int = 10, fixtures_dir: Optional[Path] = None,
+                    **options) -> int:
     """
     Record messages from a Kraken WebSocket channel.
 
+    Frames that are not valid JSON are skipped (and counted) rather than
+    ending the recording.
+
     Args:
         channel: Channel name (ticker, book, ohlc, trade)
         pair: Currency pair (e.g., BTC/USD)
         count: Number of messages to record
+        fixtures_dir: Output directory (default: fixtures/ in the repository root)
         **options: Additional subscription options
+
+    Returns:
+        Number of messages written to the fixtures JSONL file. The messages
+        themselves are not returned (they are not kept in memory); read them
+        back from <channel>_<pair>_messages_<timestamp>.jsonl, one frame per line.
     """
     url = "wss://ws.kraken.com"
-    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    if fixtures_dir is None:
+        fixtures_dir = Path(__file__).parent.parent / "fixtures"
     fixtures_dir.mkdir(exist_ok=True)
 
     print(f"Connecting to {url}...")
@@ -49,38 +174,55 @@ def record_messages(channel: str, pair: str, count: int = 10, **options):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             ack_filename = f"{channel}_{pair.replace('/', '_')}_subscription_{timestamp}.json"
             ack_path = fixtures_dir / ack_filename
-            with open(ack_path, 'w') as f:
-                json.dump(ack, f, indent=2)
+            with open(ack_path, 'wb') as f:
+                f.write(dumps_pretty(ack))
             print(f"Saved subscription ack to: {ack_filename}")
 
-            # Receive and save messages
+            # Receive messages, appending them to a JSONL file in batches
+            messages_filename = f"{channel}_{pair.replace('/', '_')}_messages_{timestamp}.jsonl"
+            messages_path = fixtures_dir / messages_filename
+
             print(f"\nReceiving messages...")
-            messages = []
+            batch = []
             msg_count = 0
+            malformed = 0
+            writer = _JsonlWriter(messages_path)
+            writer.start()
 
-            while msg_count < count:
-                msg = client.receive_message()
+            try:
+                while msg_count < count:
+                    raw = client.receive_raw()
 
-                # Skip heartbeat messages
-                if isinstance(msg, dict) and msg.get("event") == "heartbeat":
-                    print(".", end="", flush=True)
-                    continue
+                    # Skip heartbeat and system status messages (one lookup per message)
+                    event = _frame_event(raw)
+                    if event is _MALFORMED:
+                        malformed += 1
+                        continue
+                    if event in _SKIP_EVENTS:
+                        if event == "heartbeat":
+                            print(".", end="", flush=True)
+                        continue
 
-                # Skip system status messages
-                if isinstance(msg, dict) and msg.get("event") == "systemStatus":
-                    continue
+                    # Keep the frame as received; no re-encoding
+                    batch.append(raw if isinstance(raw, bytes) else raw.encode())
+                    msg_count += 1
 
-                messages.append(msg)
-                msg_count += 1
-                print(f"\n[{msg_count}/{count}] Received message")
+                    if len(batch) >= FLUSH_EVERY:
+                        writer.submit(batch)
+                        batch = []
+                    if msg_count % PROGRESS_EVERY == 0 or msg_count == count:
+                        print(f"\n[{msg_count}/{count}] Received messages")
 
-            print(f"\nReceived {len(messages)} messages")
+                if batch:
+                    writer.submit(batch)
+            finally:
+                writer.close()
 
-            # Save messages
-            messages_filename = f"{channel}_{pair.replace('/', '_')}_messages_{timestamp}.json"
-            messages_path = fixtures_dir / messages_filename
-            with open(messages_path, 'w') as f:
-                json.dump(messages, f, indent=2)
+            print(f"\nReceived {msg_count} messages")
+            if malformed:
+                print(f"Skipped {malformed} malformed frames (not valid JSON)")
+            if writer.dropped:
+                print(f"Dropped {writer.dropped} messages (writer fell behind)")
             print(f"Saved messages to: {messages_filename}")
 
             # Unsubscribe
@@ -89,7 +231,7 @@ def record_messages(channel: str, pair: str, count: int = 10, **options):
             print(f"Unsubscription status: {unsubscribe_ack.get('status')}")
 
             print("\nRecording complete!")
-            return messages
+            return msg_count - writer.dropped
 
     except KeyboardInterrupt:
         print("\n\nRecording interrupted by user")
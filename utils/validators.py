@@ -1,20 +1,124 @@
+import json
 import jsonschema
-from typing import Dict, List, Any
-from datetime import datetime
+import jsonschema_rs
+import numpy as np
+import time
+from functools import cache
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+SCHEMAS_DIR = Path(__file__).resolve().parent.parent / "schemas"
+# Channel name -> schema file (schemas/<name>_schema.json)
+_CHANNEL_SCHEMAS = {
+    "ticker": "ticker",
+    "book": "book",
+    "ohlc": "candles",
+    "trade": "trade",
+}
+
+# id(schema) -> (schema, validate). Holding the schema keeps its id from being
+# reused by another object while the entry exists.
+_VALIDATORS_BY_ID: Dict[int, Tuple[Dict, Callable[[Any], None]]] = {}
+_MAX_VALIDATORS_BY_ID = 128
+
+
+def _compile(schema: Dict) -> Callable[[Any], None]:
+    """
+    Build a validate(message) callable for a schema.
+
+    The schema is compiled once into a jsonschema-rs (Rust) validator; failures
+    are re-raised as jsonschema.ValidationError so callers see the same error
+    type jsonschema.validate() raises.
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        Callable raising jsonschema.ValidationError for invalid messages
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    jsonschema.validators.validator_for(schema).check_schema(schema)
+    rs_validator = jsonschema_rs.validator_for(schema, validate_formats=True)
+
+    def validate(message: Any) -> None:
+        try:
+            rs_validator.validate(message)
+        except jsonschema_rs.ValidationError as e:
+            raise jsonschema.ValidationError(
+                e.message, validator=e.schema_path[-1] if e.schema_path else None,
+                path=list(e.instance_path), schema_path=list(e.schema_path), instance=e.instance
+            ) from None
+
+    return validate
+
+
+def _get_validator(schema: Dict) -> Callable[[Any], None]:
+    """
+    Return the compiled validate callable for a schema, compiling it on first use.
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        Callable raising jsonschema.ValidationError for invalid messages
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    entry = _VALIDATORS_BY_ID.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    validate = _compile(schema)
+    if len(_VALIDATORS_BY_ID) >= _MAX_VALIDATORS_BY_ID:
+        _VALIDATORS_BY_ID.clear()
+    _VALIDATORS_BY_ID[id(schema)] = (schema, validate)
+    return validate
 
 
-def validate_schema(message: Dict, schema: Dict) -> None:
+@cache
+def get_validator(channel: str) -> Callable[[Any], None]:
+    """
+    Return the compiled validator for a channel's schema, built once per process.
+
+    Args:
+        channel: Channel name ('ticker', 'book', 'ohlc', 'trade')
+
+    Returns:
+        Callable raising jsonschema.ValidationError for invalid messages
+
+    Raises:
+        ValueError: If no schema is registered for the channel
+    """
+    name = _CHANNEL_SCHEMAS.get(channel)
+    if name is None:
+        raise ValueError(f"No schema registered for channel: {channel}")
+    return _compile(json.loads((SCHEMAS_DIR / f"{name}_schema.json").read_bytes()))
+
+
+def validate_schema(message: Dict, schema: Optional[Dict] = None, *, channel: Optional[str] = None) -> None:
     """
     Validate message against JSON schema.
 
+    Pass channel= to use the process-wide validator for that channel's schema
+    file; a schema dict is compiled once and cached per schema.
+
     Args:
         message: Message to validate
         schema: JSON schema
+        channel: Channel name to look up the schema by, instead of schema
 
     Raises:
         jsonschema.ValidationError: If validation fails
     """
-    jsonschema.validate(instance=message, schema=schema)
+    if channel is not None:
+        get_validator(channel)(message)
+    elif schema is not None:
+        _get_validator(schema)(message)
+    else:
+        raise TypeError("validate_schema() needs a schema or a channel")
 
 
 def validate_timestamp(timestamp: Any, allow_future: bool = False) -> bool:
@@ -32,17 +136,13 @@ def validate_timestamp(timestamp: Any, allow_future: bool = False) -> bool:
         ValueError: If timestamp is invalid
     """
     try:
-        if isinstance(timestamp, str):
-            ts = float(timestamp)
-        else:
-            ts = float(timestamp)
+        ts = float(timestamp)
 
         if ts <= 0:
             raise ValueError(f"Timestamp must be positive: {ts}")
 
         if not allow_future:
-            now = datetime.now().timestamp()
-            if ts > now + 60:  # Allow 60 second clock skew
+            if ts > time.time() + 60:  # Allow 60 second clock skew
                 raise ValueError(f"Timestamp is too far in future: {ts}")
 
         return True
@@ -50,6 +150,45 @@ def validate_timestamp(timestamp: Any, allow_future: bool = False) -> bool:
         raise ValueError(f"Invalid timestamp: {timestamp} - {e}")
 
 
+def _float_array(values: Any, name: str) -> np.ndarray:
+    """
+    Convert values to the float64 array the vectorized validators work on.
+
+    Args:
+        values: List (or ndarray) of numbers or numeric strings
+        name: What a value is, for the error message (e.g. 'timestamp')
+
+    Returns:
+        float64 array (values itself if it already is one)
+
+    Raises:
+        ValueError: For the first value that is not a number, in
+            validate_timestamp's "Invalid <name>: <value> - <reason>" format.
+            NaN is rejected too, since it passes every comparison.
+    """
+    if isinstance(values, np.ndarray) and values.dtype == np.float64:
+        arr = values
+    else:
+        try:
+            arr = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            # Cold path: name the offending entry instead of numpy's message
+            for value in values:
+                try:
+                    float(value)
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Invalid {name}: {value} - {e}") from None
+            raise
+
+    nan = np.isnan(arr)
+    if nan.any():
+        i = int(np.argmax(nan))
+        # None converts to NaN too; report the value as given
+        value = arr.flat[i] if isinstance(values, np.ndarray) else values[i]
+        raise ValueError(f"Invalid {name}: {value} - not a number (index {i})")
+    return arr
+
+
 def validate_timestamps_increasing(timestamps: List[float]) -> bool:
     """
     Validate that timestamps are strictly increasing.
@@ -61,24 +200,93 @@ def validate_timestamps_increasing(timestamps: List[float]) -> bool:
         True if strictly increasing
 
     Raises:
-        ValueError: If timestamps are not increasing
+        ValueError: If timestamps are not increasing, or one is not a number
     """
-    for i in range(1, len(timestamps)):
-        if timestamps[i] <= timestamps[i-1]:
-            raise ValueError(
-                f"Timestamps not strictly increasing: "
-                f"{timestamps[i-1]} >= {timestamps[i]} at index {i}"
-            )
+    steps = np.diff(_float_array(timestamps, "timestamp"))
+    if not (steps > 0).all():
+        # Locate the first offender only on the failure path
+        i = int(np.argmax(steps <= 0)) + 1
+        raise ValueError(
+            f"Timestamps not strictly increasing: "
+            f"{timestamps[i-1]} >= {timestamps[i]} at index {i}"
+        )
     return True
 
 
+def validate_timestamps(timestamps: List[float], allow_future: bool = False) -> bool:
+    """
+    Validate a timestamp series: each positive and not in the future, and strictly increasing.
+
+    Combines validate_timestamp and validate_timestamps_increasing into one
+    vectorized pass; the clock is read once for the whole series.
+
+    Args:
+        timestamps: List (or array) of timestamp values
+        allow_future: Whether to allow future timestamps
+
+    Returns:
+        True if valid
+
+    Raises:
+        ValueError: For the first invalid or out-of-order timestamp
+    """
+    arr = _float_array(timestamps, "timestamp")
+    positive = arr > 0
+    values_ok = positive.copy()
+    if not allow_future:
+        max_ts = time.time() + 60  # Allow 60 second clock skew; read once for the whole series
+        values_ok &= arr <= max_ts
+    steps_ok = np.diff(arr) > 0
+
+    if values_ok.all() and steps_ok.all():
+        return True
+
+    # Cold path: describe the first failure from the masks above, in
+    # validate_timestamp's and validate_timestamps_increasing's formats
+    if not values_ok.all():
+        i = int(np.argmax(~values_ok))
+        ts = arr[i].item()
+        if not positive[i]:
+            reason = f"Timestamp must be positive: {ts}"
+        else:
+            reason = f"Timestamp is too far in future: {ts}"
+        raise ValueError(f"Invalid timestamp: {timestamps[i]} - {reason} (index {i})")
+
+    i = int(np.argmax(~steps_ok)) + 1
+    raise ValueError(
+        f"Timestamps not strictly increasing: "
+        f"{timestamps[i-1]} >= {timestamps[i]} at index {i}"
+    )
+
+
+def _best_price(levels: Any) -> Any:
+    """
+    First price of one side of the book, or None if the side is empty.
+
+    Each side is looked at on its own, so an ndarray and a list can be mixed.
+
+    Args:
+        levels: List of [price, volume, ...] entries, or an ndarray of
+            (levels, fields) entries or of prices
+
+    Returns:
+        The first price as stored (float, or str for v1 API entries), or None
+    """
+    if isinstance(levels, np.ndarray):
+        # item(0) is levels[0, 0] of a (levels, fields) array, or levels[0] of
+        # a price column; float64 arrays yield a Python float directly
+        return levels.item(0) if levels.size else None
+    return levels[0][0] if levels else None
+
+
 def validate_book_not_crossed(bids: List, asks: List) -> bool:
     """
     Validate that order book is not crossed.
 
     Args:
-        bids: List of bid entries [price, volume, ...]
-        asks: List of ask entries [price, volume, ...]
+        bids: List (or ndarray) of bid entries [price, volume, ...]; each side
+            may be either type
+        asks: List (or ndarray) of ask entries [price, volume, ...]
 
     Returns:
         True if book is not crossed
@@ -86,11 +294,16 @@ def validate_book_not_crossed(bids: List, asks: List) -> bool:
     Raises:
         ValueError: If book is crossed
     """
-    if not bids or not asks:
+    best_bid = _best_price(bids)
+    best_ask = _best_price(asks)
+    if best_bid is None or best_ask is None:
         return True  # Empty book is not crossed
 
-    best_bid = float(bids[0][0])
-    best_ask = float(asks[0][0])
+    # Only string prices (v1 API, or arrays of str) still need converting
+    if type(best_bid) is not float:
+        best_bid = float(best_bid)
+    if type(best_ask) is not float:
+        best_ask = float(best_ask)
 
     if best_bid >= best_ask:
         raise ValueError(
@@ -105,28 +318,33 @@ def validate_price_ordering(prices: List[float], descending: bool = True) -> boo
     Validate that prices are in correct order.
 
     Args:
-        prices: List of prices
+        prices: List of prices, or an ndarray of prices or of (levels, fields)
+            book entries whose first column is the price
         descending: True for descending order (bids), False for ascending (asks)
 
     Returns:
         True if correctly ordered
 
     Raises:
-        ValueError: If prices are not correctly ordered
+        ValueError: If prices are not correctly ordered, or one is not a number
     """
-    for i in range(1, len(prices)):
+    if isinstance(prices, np.ndarray) and prices.ndim == 2:
+        prices = prices[:, 0]
+    # float64 arrays are used as they are; no conversion pass
+    steps = np.diff(_float_array(prices, "price"))
+    # The direction picks the comparison once; the sweep itself has no branch
+    bad = steps > 0 if descending else steps < 0
+    if bad.any():
+        i = int(np.argmax(bad)) + 1
         if descending:
-            if prices[i] > prices[i-1]:
-                raise ValueError(
-                    f"Prices not in descending order: "
-                    f"{prices[i-1]} < {prices[i]} at index {i}"
-                )
-        else:
-            if prices[i] < prices[i-1]:
-                raise ValueError(
-                    f"Prices not in ascending order: "
-                    f"{prices[i-1]} > {prices[i]} at index {i}"
-                )
+            raise ValueError(
+                f"Prices not in descending order: "
+                f"{prices[i-1]} < {prices[i]} at index {i}"
+            )
+        raise ValueError(
+            f"Prices not in ascending order: "
+            f"{prices[i-1]} > {prices[i]} at index {i}"
+        )
     return True
 
 
@@ -146,6 +364,11 @@ def validate_ohlc_relationships(open_price: float, high: float, low: float, clos
     Raises:
         ValueError: If OHLC relationships are invalid
     """
+    # Happy path: one comparison chain (also implies low <= high)
+    if low <= open_price <= high and low <= close <= high:
+        return True
+
+    # Cold path: find which relationship failed
     if low > open_price:
         raise ValueError(f"Low ({low}) > Open ({open_price})")
     if low > close:
@@ -161,6 +384,38 @@ def validate_ohlc_relationships(open_price: float, high: float, low: float, clos
     return True
 
 
+def validate_ohlc_relationships_batch(open_price: Any, high: Any, low: Any, close: Any) -> bool:
+    """
+    Validate OHLC relationships for many candles at once.
+
+    Args:
+        open_price: Opening prices (array-like, one per candle)
+        high: High prices
+        low: Low prices
+        close: Closing prices
+
+    Returns:
+        True if relationships are valid for every candle
+
+    Raises:
+        ValueError: For the first candle whose OHLC relationships are invalid,
+            or the first price that is not a number
+    """
+    o = _float_array(open_price, "open price")
+    h = _float_array(high, "high price")
+    lo = _float_array(low, "low price")
+    c = _float_array(close, "close price")
+
+    bad = (lo > o) | (lo > c) | (lo > h) | (h < o) | (h < c)
+    if bad.any():
+        i = int(np.argmax(bad))
+        try:
+            validate_ohlc_relationships(o[i].item(), h[i].item(), lo[i].item(), c[i].item())
+        except ValueError as e:
+            raise ValueError(f"Candle {i}: {e}") from None
+    return True
+
+
 def validate_positive(value: float, field_name: str = "value") -> bool:
     """
     Validate that a numeric value is positive.
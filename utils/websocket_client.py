@@ -1,7 +1,71 @@
 import json
 import time
 import websocket
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+
+from ._jsonio import dumps, loads
+
+
+def _encode_request(method: str, channel: str, symbol: Any, options: Dict) -> bytes:
+    """Encode a subscribe/unsubscribe request (v2 API format)."""
+    params = {
+        "channel": channel,
+        "symbol": symbol
+    }
+    params.update(options)
+
+    return dumps({"method": method, "params": params})
+
+
+# Symbol/option value types that can be part of a _request_payload cache key
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=None, typed=True)
+def _request_payload(method: str, channel: str, symbols: Tuple[Tuple[type, Any], ...],
+                     options: Tuple[Tuple[str, type, Any], ...]) -> bytes:
+    """
+    Encode a subscribe/unsubscribe request once per combination.
+
+    Values are keyed together with their type, since True == 1 == 1.0 would
+    otherwise share a cache entry (negative tests send each of them).
+
+    Args:
+        method: 'subscribe' or 'unsubscribe'
+        channel: Channel name
+        symbols: (type, symbol) pairs
+        options: (name, type, value) triples in call order
+
+    Returns:
+        JSON-encoded request ready to send
+    """
+    return _encode_request(method, channel, [s for _, s in symbols], {k: v for k, _, v in options})
+
+
+def _build_request(method: str, channel: str, symbol: Any, options: Dict) -> bytes:
+    """Return the encoded request, reusing the cached payload when it only holds JSON scalars."""
+    if not (isinstance(symbol, (list, tuple))
+            and all(isinstance(s, _CACHEABLE_TYPES) for s in symbol)
+            and all(isinstance(v, _CACHEABLE_TYPES) for v in options.values())):
+        # Scalar symbol, or nested values such as lists (negative tests): encode as given
+        return _encode_request(method, channel, symbol, options)
+    return _request_payload(method, channel,
+                            tuple((type(s), s) for s in symbol),
+                            tuple((k, type(v), v) for k, v in options.items()))
+
+
+# Frames that never carry channel data (v2 API)
+_SKIP_CHANNELS = frozenset(("heartbeat", "status"))
+_SKIP_METHODS = frozenset(("subscribe", "unsubscribe"))
+
+
+def _is_data_message(msg: Any) -> bool:
+    """Return False for heartbeat/status frames and subscribe/unsubscribe acks (v2 API)."""
+    if not isinstance(msg, dict):
+        return True
+    return msg.get("channel") not in _SKIP_CHANNELS and msg.get("method") not in _SKIP_METHODS
 
 
 class KrakenWebSocketClient:
@@ -15,27 +79,38 @@ class KrakenWebSocketClient:
     - Automatic cleanup
     """
 
-    def __init__(self, url: str, timeout: int = 30):
+    def __init__(self, url: str, timeout: int = 30, fast_close: bool = False):
         """
         Initialize WebSocket client.
 
         Args:
             url: WebSocket endpoint URL
             timeout: Timeout for operations in seconds
+            fast_close: Drop the socket on disconnect instead of performing the
+                close handshake (saves a round-trip per connection; opt in where
+                the server does not need a clean close, e.g. test fixtures)
         """
         self.url = url
         self.timeout = timeout
+        self.fast_close = fast_close
         self.ws: Optional[websocket.WebSocket] = None
+        # Timeout currently set on the socket, so it is only changed when it differs
+        self._ws_timeout: Optional[float] = None
         self.messages: List[Dict] = []
 
     def connect(self) -> None:
         """Establish WebSocket connection."""
         self.ws = websocket.create_connection(self.url, timeout=self.timeout)
+        self._ws_timeout = self.timeout
 
     def disconnect(self) -> None:
         """Close WebSocket connection."""
         if self.ws:
-            self.ws.close()
+            if self.fast_close:
+                # No CLOSE frame, no wait for the server's reply
+                self.ws.shutdown()
+            else:
+                self.ws.close()
             self.ws = None
 
     def subscribe(self, channel: str, symbol: List[str], **options) -> Dict:
@@ -56,19 +131,7 @@ class KrakenWebSocketClient:
         if not self.ws:
             raise RuntimeError("Not connected. Call connect() first.")
 
-        # v2 API format
-        params = {
-            "channel": channel,
-            "symbol": symbol
-        }
-        params.update(options)
-
-        request = {
-            "method": "subscribe",
-            "params": params
-        }
-
-        self.ws.send(json.dumps(request))
+        self.ws.send(_build_request("subscribe", channel, symbol, options))
 
         # Wait for subscription acknowledgment (v2 format)
         ack = self._wait_for_method("subscribe")
@@ -80,6 +143,77 @@ class KrakenWebSocketClient:
 
         return ack
 
+    def subscribe_many(self, items: List[Tuple[str, List[str], Dict]]) -> List[Dict]:
+        """
+        Subscribe to several channels with a single round-trip (WebSocket v2 API).
+
+        Items with the same channel and options are merged into one request.
+        All requests are sent back-to-back (tagged with req_id) before any
+        acknowledgment is awaited. Kraken acknowledges each symbol of a request
+        separately, so acks are collected until every symbol is accounted for.
+
+        Args:
+            items: (channel, symbols, options) tuples, e.g. ('book', ['BTC/USD'], {'depth': 10})
+
+        Returns:
+            Every acknowledgment, grouped by request in send order
+
+        Raises:
+            ValueError: If any subscription fails
+            TimeoutError: If not every symbol is acknowledged within the timeout
+        """
+        if not self.ws:
+            raise RuntimeError("Not connected. Call connect() first.")
+
+        # (channel, canonical options) -> [channel, symbols, options]
+        merged: Dict[Tuple[str, str], List] = {}
+        for channel, symbol, options in items:
+            key = (channel, json.dumps(options, sort_keys=True))
+            entry = merged.setdefault(key, [channel, [], options])
+            entry[1].extend(s for s in symbol if s not in entry[1])
+
+        # req_id -> symbols not acknowledged yet
+        pending: Dict[int, set] = {}
+        for req_id, (channel, symbol, options) in enumerate(merged.values(), start=1):
+            params = {"channel": channel, "symbol": symbol}
+            params.update(options)
+            self.ws.send(dumps({"method": "subscribe", "params": params, "req_id": req_id}))
+            pending[req_id] = set(symbol)
+
+        acks: Dict[int, List[Dict]] = {req_id: [] for req_id in pending}
+        deadline = time.monotonic() + self.timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                missing = sorted(s for symbols in pending.values() for s in symbols)
+                raise TimeoutError(f"Timeout waiting for subscribe acks. Missing: {missing}")
+
+            msg = self.receive_message(timeout=remaining)
+            if not (isinstance(msg, dict) and msg.get("method") == "subscribe"):
+                continue
+            req_id = msg.get("req_id")
+            if req_id not in pending:
+                continue
+
+            acks[req_id].append(msg)
+            # Success acks name their symbol in 'result', error acks at the top level
+            symbol = (msg.get("result") or {}).get("symbol", msg.get("symbol"))
+            if symbol is None:
+                # An error for the request as a whole; no per-symbol acks follow
+                pending[req_id].clear()
+            else:
+                pending[req_id].discard(symbol)
+            if not pending[req_id]:
+                del pending[req_id]
+
+        ordered = [ack for req_id in sorted(acks) for ack in acks[req_id]]
+        for ack in ordered:
+            if not ack.get("success"):
+                error = ack.get("error", "Unknown error")
+                raise ValueError(f"Subscription failed: {error}")
+
+        return ordered
+
     def _wait_for_method(self, method: str, timeout: Optional[int] = None) -> Dict:
         """
         Wait for a specific method response (v2 API).
@@ -91,54 +225,64 @@ class KrakenWebSocketClient:
         Returns:
             Method response message
         """
-        start_time = time.time()
-        effective_timeout = timeout or self.timeout
+        deadline = time.monotonic() + (timeout or self.timeout)
 
         while True:
-            elapsed = time.time() - start_time
-            if elapsed > effective_timeout:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 raise TimeoutError(f"Timeout waiting for method: {method}")
 
-            remaining = effective_timeout - elapsed
             msg = self.receive_message(timeout=remaining)
 
             if isinstance(msg, dict) and msg.get("method") == method:
                 return msg
 
-    def unsubscribe(self, channel: str, symbol: List[str], **options) -> Dict:
+    def unsubscribe(self, channel: str, symbol: List[str], timeout: Optional[float] = None, **options) -> Dict:
         """
         Unsubscribe from a channel and validate acknowledgment (WebSocket v2 API).
 
         Args:
             channel: Channel name
             symbol: List of currency pairs
+            timeout: Optional override of the wait for the acknowledgment
             **options: Additional subscription options
 
         Returns:
             Unsubscription acknowledgment message
+
+        Raises:
+            TimeoutError: If no acknowledgment arrives within the timeout
+            websocket.WebSocketTimeoutException: If the socket stays silent
         """
         if not self.ws:
             raise RuntimeError("Not connected. Call connect() first.")
 
-        # v2 API format
-        params = {
-            "channel": channel,
-            "symbol": symbol
-        }
-        params.update(options)
-
-        request = {
-            "method": "unsubscribe",
-            "params": params
-        }
-
-        self.ws.send(json.dumps(request))
+        self.ws.send(_build_request("unsubscribe", channel, symbol, options))
 
         # Wait for unsubscription acknowledgment
-        ack = self._wait_for_method("unsubscribe")
+        ack = self._wait_for_method("unsubscribe", timeout=timeout)
 
         return ack
 
+    def receive_raw(self, timeout: Optional[int] = None) -> Union[str, bytes]:
+        """
+        Receive a single frame from WebSocket without parsing it.
+
+        Args:
+            timeout: Optional timeout override (None uses the client timeout)
+
+        Returns:
+            Frame payload as received (str for text frames)
+        """
+        if not self.ws:
+            raise RuntimeError("Not connected. Call connect() first.")
+
+        effective_timeout = self.timeout if timeout is None else timeout
+        if effective_timeout != self._ws_timeout:
+            self.ws.settimeout(effective_timeout)
+            self._ws_timeout = effective_timeout
+        return self.ws.recv()
+
     def receive_message(self, timeout: Optional[int] = None) -> Dict:
         """
         Receive a single message from WebSocket.
@@ -149,18 +293,51 @@ class KrakenWebSocketClient:
         Returns:
             Parsed JSON message
         """
-        if not self.ws:
-            raise RuntimeError("Not connected. Call connect() first.")
+        return loads(self.receive_raw(timeout))
 
-        original_timeout = self.ws.gettimeout()
-        try:
-            if timeout is not None:
-                self.ws.settimeout(timeout)
-            data = self.ws.recv()
-            message = json.loads(data)
-            return message
-        finally:
-            self.ws.settimeout(original_timeout)
+    def receive_data_message(self, timeout: Optional[int] = None) -> Dict:
+        """
+        Receive the next channel data message, skipping heartbeats, status and acks.
+
+        Args:
+            timeout: Optional timeout override
+
+        Returns:
+            Parsed data message
+
+        Raises:
+            TimeoutError: If only non-data frames arrive within the timeout
+            websocket.WebSocketTimeoutException: If the socket stays silent
+        """
+        deadline = time.monotonic() + (timeout or self.timeout)
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Timeout waiting for data message")
+
+            msg = self.receive_message(timeout=remaining)
+            if _is_data_message(msg):
+                return msg
+
+    def _iter_user_messages(self, deadline: float) -> Iterator[Any]:
+        """
+        Yield channel data messages until the deadline, skipping heartbeats, status and acks.
+
+        Args:
+            deadline: time.monotonic() value at which the generator stops
+
+        Yields:
+            Parsed data messages
+        """
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+
+            msg = self.receive_message(timeout=remaining)
+            if _is_data_message(msg):
+                yield msg
 
     def receive_messages(self, count: int = 10, timeout: Optional[int] = None) -> List[Dict]:
         """
@@ -174,33 +351,19 @@ class KrakenWebSocketClient:
             List of parsed messages
         """
         messages = []
-        start_time = time.time()
-        effective_timeout = timeout or self.timeout
-
-        while len(messages) < count:
-            elapsed = time.time() - start_time
-            if elapsed > effective_timeout:
-                raise TimeoutError(f"Timeout receiving messages. Got {len(messages)}/{count}")
-
-            remaining = effective_timeout - elapsed
-            try:
-                msg = self.receive_message(timeout=remaining)
-                # Filter out heartbeat messages (v2 API uses "heartbeat" channel)
-                if isinstance(msg, dict) and msg.get("channel") == "heartbeat":
-                    continue
-                # Filter out status messages
-                if isinstance(msg, dict) and msg.get("channel") == "status":
-                    continue
-                # Filter out method response messages (subscribe/unsubscribe acknowledgments)
-                if isinstance(msg, dict) and msg.get("method") in ["subscribe", "unsubscribe"]:
-                    continue
-                messages.append(msg)
-            except Exception as e:
-                if len(messages) > 0:
-                    # Got some messages, return what we have
-                    break
-                raise
+        deadline = time.monotonic() + (timeout or self.timeout)
 
+        try:
+            for msg in islice(self._iter_user_messages(deadline), count):
+                messages.append(msg)
+        except Exception:
+            if messages:
+                # Got some messages, return what we have
+                return messages
+            raise
+
+        if len(messages) < count:
+            raise TimeoutError(f"Timeout receiving messages. Got {len(messages)}/{count}")
         return messages
 
     def __enter__(self):